@@ -7,9 +7,16 @@ based on sensor data and configuration.
 
 import logging
 import math
+from collections import ChainMap
+from collections.abc import Callable, Hashable, Mapping, Sequence
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter
+from types import MappingProxyType
 from typing import Any
 
+import numpy as np
+
 from custom_components.room_ventilation_advisor.const import (
     CONF_ADVANCED_SETTINGS,
     CONF_CO2_THRESHOLDS,
@@ -31,10 +38,11 @@ from custom_components.room_ventilation_advisor.const import (
     ROOM_TYPE_KITCHEN,
     ROOM_TYPE_LIVING_ROOM,
     ROOM_TYPE_OFFICE,
+    ROOM_TYPES,
 )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RoomData:
     """Data class for room sensor readings."""
 
@@ -51,128 +59,345 @@ class RoomData:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Field getters used to unpack RoomData rows in a single call per room
+_ROOM_READINGS = attrgetter(
+    "temp_in",
+    "humidity_in",
+    "temp_out",
+    "humidity_out",
+    "wind_speed",
+)
+_ROOM_SCHEDULE = attrgetter("hour", "month")
+
+# Magnus formula coefficients and the combined absolute humidity constant
+# (saturation vapour pressure at 0 °C in hPa times the g/m³ conversion)
+_MAGNUS_A = 17.67
+_MAGNUS_B = 243.5
+_ABS_ZERO = 273.15
+_ABS_HUMIDITY_K = 6.112 * 2.1674
+
+# Pattern factor for room types without a known occupancy pattern
+_DEFAULT_PATTERN_FACTOR = 0.2
+
+# Hours of increased ventilation need per room type
+_BEDROOM_HI = frozenset({6, 7, 8, 9, 21, 22, 23})
+_BATHROOM_HI = frozenset({6, 7, 8, 9, 18, 19, 20, 21, 22})
+_OFFICE_HI = frozenset(range(8, 18))
+_KITCHEN_MORNING = frozenset({6, 7, 8})
+_KITCHEN_PEAK = frozenset({11, 12, 13, 17, 18, 19, 20})
+_LIVING_MORNING = frozenset({6, 7, 8, 9})
+_LIVING_EVENING = frozenset({17, 18, 19, 20, 21, 22})
+_LIVING_DAY = frozenset(range(10, 17))
+
+# Hours with high and moderate time of day factor
+_TIME_HIGH = frozenset({7, 8, 9, 18, 19, 20})
+_TIME_MOD = frozenset({6, 10, 11, 16, 17, 21})
+
+# Hour table slot shared by all hours outside 0-23, which are off-peak
+_OFF_PEAK_SLOT = 24
+
+# Month table slot holding the default season, used for months outside 1-12
+_DEFAULT_MONTH_SLOT = 0
+_MONTHS = range(1, 13)
+
+
+@lru_cache(maxsize=4096)
+def _absolute_humidity(humidity_percent: float, temp_celsius: float) -> float:
+    """
+    Calculate absolute humidity in g/m³.
+
+    Cached because rooms sharing the outdoor sensors repeat the same
+    outdoor readings on every update.
+    """
+    return (
+        humidity_percent
+        * _ABS_HUMIDITY_K
+        * math.exp(_MAGNUS_A * temp_celsius / (temp_celsius + _MAGNUS_B))
+        / (_ABS_ZERO + temp_celsius)
+    )
+
+
+def _room_pattern_factor(room_type: str, hour: int) -> float:
+    """Return the occupancy based CO2 factor used when no CO2 sensor exists."""
+    patterns = {
+        ROOM_TYPE_BEDROOM: 0.8 if hour in _BEDROOM_HI else 0.2,
+        ROOM_TYPE_BATHROOM: 0.7 if hour in _BATHROOM_HI else 0.3,
+        ROOM_TYPE_OFFICE: 0.8 if hour in _OFFICE_HI else 0.2,
+        ROOM_TYPE_KITCHEN: (
+            0.8 if hour in _KITCHEN_MORNING else (0.9 if hour in _KITCHEN_PEAK else 0.3)
+        ),
+        ROOM_TYPE_LIVING_ROOM: (
+            0.7
+            if hour in _LIVING_MORNING
+            else (
+                0.6
+                if hour in _LIVING_EVENING
+                else (0.3 if hour in _LIVING_DAY else 0.2)
+            )
+        ),
+    }
+    return patterns.get(room_type, _DEFAULT_PATTERN_FACTOR)
+
+
+def _no_wind_factor(_wind_speed: float) -> float:
+    """Return the wind factor used when the wind factor is disabled."""
+    return 0
+
+
+def _hour_time_factor(hour: int) -> float:
+    """Return the time of day factor for an hour."""
+    return 0.8 if hour in _TIME_HIGH else (0.5 if hour in _TIME_MOD else 0.2)
+
+
+def _hour_slot(hour: int) -> int:
+    """Return the hour table slot for an hour."""
+    return hour if 0 <= hour < _OFF_PEAK_SLOT else _OFF_PEAK_SLOT
+
+
+def _month_slot(month: int) -> int:
+    """Return the month table slot for a month."""
+    return month if month in _MONTHS else _DEFAULT_MONTH_SLOT
+
 
 class VentilationCalculator:
     """Core calculation logic for ventilation recommendations."""
 
-    def __init__(self, config: dict[str, Any]) -> None:
+    # Thresholds, weights and time factors read from the advanced settings
+    temp_winter_good: float
+    temp_winter_moderate: float
+    temp_summer_good: float
+    temp_summer_moderate: float
+    temp_default_good: float
+    temp_default_moderate: float
+    humidity_good: float
+    humidity_moderate: float
+    co2_very_poor: float
+    co2_poor: float
+    co2_moderate: float
+    wind_no_effect: float
+    wind_moderate_effect: float
+    weight_temp: float
+    weight_humidity: float
+    weight_co2: float
+    weight_time: float
+    weight_temp_with_co2: float
+    weight_humidity_with_co2: float
+    weight_co2_with_sensor: float
+    weight_time_with_co2: float
+    time_high: list[int]
+    time_moderate: list[int]
+    time_low: list[int]
+
+    # Settings section, section defaults and (attribute, key) pairs
+    _SCHEMA: tuple[
+        tuple[str, Mapping[str, Any], tuple[tuple[str, str], ...]],
+        ...,
+    ] = (
+        (
+            CONF_TEMPERATURE_THRESHOLDS,
+            DEFAULT_TEMPERATURE_THRESHOLDS,
+            (
+                ("temp_winter_good", "winter_good"),
+                ("temp_winter_moderate", "winter_moderate"),
+                ("temp_summer_good", "summer_good"),
+                ("temp_summer_moderate", "summer_moderate"),
+                ("temp_default_good", "default_good"),
+                ("temp_default_moderate", "default_moderate"),
+            ),
+        ),
+        (
+            CONF_HUMIDITY_THRESHOLDS,
+            DEFAULT_HUMIDITY_THRESHOLDS,
+            (("humidity_good", "good"), ("humidity_moderate", "moderate")),
+        ),
+        (
+            CONF_CO2_THRESHOLDS,
+            DEFAULT_CO2_THRESHOLDS,
+            (
+                ("co2_very_poor", "very_poor"),
+                ("co2_poor", "poor"),
+                ("co2_moderate", "moderate"),
+            ),
+        ),
+        (
+            CONF_WIND_THRESHOLDS,
+            DEFAULT_WIND_THRESHOLDS,
+            (
+                ("wind_no_effect", "no_effect"),
+                ("wind_moderate_effect", "moderate_effect"),
+            ),
+        ),
+        (
+            CONF_SCORE_WEIGHTS,
+            DEFAULT_SCORE_WEIGHTS,
+            (
+                ("weight_temp", "temperature"),
+                ("weight_humidity", "humidity"),
+                ("weight_co2", "co2"),
+                ("weight_time", "time"),
+                ("weight_temp_with_co2", "temperature_with_co2"),
+                ("weight_humidity_with_co2", "humidity_with_co2"),
+                ("weight_co2_with_sensor", "co2_with_sensor"),
+                ("weight_time_with_co2", "time_with_co2"),
+            ),
+        ),
+        (
+            CONF_TIME_FACTORS,
+            DEFAULT_TIME_FACTORS,
+            (
+                ("time_high", "high"),
+                ("time_moderate", "moderate"),
+                ("time_low", "low"),
+            ),
+        ),
+    )
+
+    # Settings attributes are generated from _SCHEMA so the two cannot drift
+    __slots__ = (
+        "config",
+        *(attr for _section, _defaults, fields in _SCHEMA for attr, _key in fields),
+        "room_patterns",
+        "_weights_no_co2",
+        "_weights_with_co2",
+        "_enable_wind",
+        "_wind_fn",
+        "_temp_params",
+        "_time_lut",
+        "_co2_lut",
+        "_default_co2_lut",
+        "_static_no_co2",
+        "_default_static_no_co2",
+        "_room_type_index",
+        "_temp_params_array",
+        "_weights_no_co2_array",
+        "_weights_with_co2_array",
+        "_time_lut_array",
+        "_static_no_co2_array",
+    )
+
+    def __init__(self, config: Mapping[str, Any]) -> None:
         """Initialize calculator with configuration."""
-        self.config: dict[str, Any] = config
+        self.config: Mapping[str, Any] = config
 
         # Load advanced settings with defaults
-        advanced: dict[str, Any] = config.get(CONF_ADVANCED_SETTINGS, {})
+        advanced: Mapping[str, Any] = config.get(CONF_ADVANCED_SETTINGS, {})
 
-        # Temperature thresholds
-        temp_thresholds: dict[str, Any] = advanced.get(CONF_TEMPERATURE_THRESHOLDS, {})
-        self.temp_winter_good: float = temp_thresholds.get(
-            "winter_good",
-            DEFAULT_TEMPERATURE_THRESHOLDS["winter_good"],
-        )
-        self.temp_winter_moderate: float = temp_thresholds.get(
-            "winter_moderate",
-            DEFAULT_TEMPERATURE_THRESHOLDS["winter_moderate"],
-        )
-        self.temp_summer_good: float = temp_thresholds.get(
-            "summer_good",
-            DEFAULT_TEMPERATURE_THRESHOLDS["summer_good"],
-        )
-        self.temp_summer_moderate: float = temp_thresholds.get(
-            "summer_moderate",
-            DEFAULT_TEMPERATURE_THRESHOLDS["summer_moderate"],
-        )
-        self.temp_default_good: float = temp_thresholds.get(
-            "default_good",
-            DEFAULT_TEMPERATURE_THRESHOLDS["default_good"],
-        )
-        self.temp_default_moderate: float = temp_thresholds.get(
-            "default_moderate",
-            DEFAULT_TEMPERATURE_THRESHOLDS["default_moderate"],
-        )
+        for section, defaults, fields in self._SCHEMA:
+            settings = ChainMap(advanced.get(section, {}), defaults)
+            for attr, key in fields:
+                setattr(self, attr, settings[key])
 
-        # Humidity thresholds
-        humidity_thresholds: dict[str, Any] = advanced.get(CONF_HUMIDITY_THRESHOLDS, {})
-        self.humidity_good: float = humidity_thresholds.get(
-            "good",
-            DEFAULT_HUMIDITY_THRESHOLDS["good"],
-        )
-        self.humidity_moderate: float = humidity_thresholds.get(
-            "moderate",
-            DEFAULT_HUMIDITY_THRESHOLDS["moderate"],
+        # Room time patterns
+        self.room_patterns: Mapping[str, Any] = advanced.get(
+            CONF_ROOM_TIME_PATTERNS,
+            DEFAULT_ROOM_TIME_PATTERNS,
         )
 
-        # CO2 thresholds
-        co2_thresholds: dict[str, Any] = advanced.get(CONF_CO2_THRESHOLDS, {})
-        self.co2_very_poor: float = co2_thresholds.get(
-            "very_poor",
-            DEFAULT_CO2_THRESHOLDS["very_poor"],
+        # Weights as (temperature, humidity, co2, time) for each scoring mode
+        self._weights_no_co2: tuple[float, float, float, float] = (
+            self.weight_temp,
+            self.weight_humidity,
+            self.weight_co2,
+            self.weight_time,
         )
-        self.co2_poor: float = co2_thresholds.get(
-            "poor",
-            DEFAULT_CO2_THRESHOLDS["poor"],
+        self._weights_with_co2: tuple[float, float, float, float] = (
+            self.weight_temp_with_co2,
+            self.weight_humidity_with_co2,
+            self.weight_co2_with_sensor,
+            self.weight_time_with_co2,
         )
-        self.co2_moderate: float = co2_thresholds.get(
-            "moderate",
-            DEFAULT_CO2_THRESHOLDS["moderate"],
+        self._enable_wind: bool = bool(config.get("enable_wind_factor", True))
+        # Wind factor function, resolved once since enable_wind_factor is static
+        self._wind_fn: Callable[[float], float] = (
+            self._calculate_wind_factor if self._enable_wind else _no_wind_factor
         )
 
-        # Wind thresholds
-        wind_thresholds: dict[str, Any] = advanced.get(CONF_WIND_THRESHOLDS, {})
-        self.wind_no_effect: float = wind_thresholds.get(
-            "no_effect",
-            DEFAULT_WIND_THRESHOLDS["no_effect"],
-        )
-        self.wind_moderate_effect: float = wind_thresholds.get(
-            "moderate_effect",
-            DEFAULT_WIND_THRESHOLDS["moderate_effect"],
+        # Temperature factor thresholds and values per month, indexed by
+        # _month_slot. Configured months outside 1-12 are ignored. Winter is
+        # assigned last so it wins for months listed in both seasons.
+        default_params = (self.temp_default_good, 0.6, self.temp_default_moderate, 0.3)
+        temp_params = [default_params] * (len(_MONTHS) + 1)
+        for month in config.get("summer_months", [6, 7, 8]):
+            if month not in _MONTHS:
+                continue
+            temp_params[month] = (
+                self.temp_summer_good,
+                0.8,
+                self.temp_summer_moderate,
+                0.3,
+            )
+        for month in config.get("winter_months", [12, 1, 2]):
+            if month not in _MONTHS:
+                continue
+            temp_params[month] = (
+                self.temp_winter_good,
+                0.8,
+                self.temp_winter_moderate,
+                0.4,
+            )
+        self._temp_params: tuple[tuple[float, float, float, float], ...] = tuple(
+            temp_params,
         )
 
-        # Score weights
-        score_weights: dict[str, Any] = advanced.get(CONF_SCORE_WEIGHTS, {})
-        self.weight_temp: float = score_weights.get(
-            "temperature",
-            DEFAULT_SCORE_WEIGHTS["temperature"],
+        # Hour lookup tables for the time and room pattern factors, indexed
+        # by _hour_slot. The slot after hour 23 holds the off-peak factors.
+        hours = range(_OFF_PEAK_SLOT + 1)
+        self._time_lut: tuple[float, ...] = tuple(
+            _hour_time_factor(hour) for hour in hours
         )
-        self.weight_humidity: float = score_weights.get(
-            "humidity",
-            DEFAULT_SCORE_WEIGHTS["humidity"],
-        )
-        self.weight_co2: float = score_weights.get("co2", DEFAULT_SCORE_WEIGHTS["co2"])
-        self.weight_time: float = score_weights.get(
-            "time",
-            DEFAULT_SCORE_WEIGHTS["time"],
-        )
-        self.weight_temp_with_co2: float = score_weights.get(
-            "temperature_with_co2",
-            DEFAULT_SCORE_WEIGHTS["temperature_with_co2"],
-        )
-        self.weight_humidity_with_co2: float = score_weights.get(
-            "humidity_with_co2",
-            DEFAULT_SCORE_WEIGHTS["humidity_with_co2"],
-        )
-        self.weight_co2_with_sensor: float = score_weights.get(
-            "co2_with_sensor",
-            DEFAULT_SCORE_WEIGHTS["co2_with_sensor"],
-        )
-        self.weight_time_with_co2: float = score_weights.get(
-            "time_with_co2",
-            DEFAULT_SCORE_WEIGHTS["time_with_co2"],
+        self._co2_lut: dict[str, tuple[float, ...]] = {
+            room_type: tuple(_room_pattern_factor(room_type, hour) for hour in hours)
+            for room_type in ROOM_TYPES
+        }
+        self._default_co2_lut: tuple[float, ...] = tuple(
+            _DEFAULT_PATTERN_FACTOR for _hour in hours
         )
 
-        # Time factors
-        time_factors: dict[str, Any] = advanced.get(CONF_TIME_FACTORS, {})
-        self.time_high: float = time_factors.get("high", DEFAULT_TIME_FACTORS["high"])
-        self.time_moderate: float = time_factors.get(
-            "moderate",
-            DEFAULT_TIME_FACTORS["moderate"],
+        # Weighted CO2 pattern and time factor terms per room type and hour,
+        # which is all of the score that does not depend on readings without
+        # CO2. The terms are kept apart so scores sum in the original order.
+        _, _, w_co2, w_time = self._weights_no_co2
+        self._static_no_co2: dict[str, tuple[tuple[float, float], ...]] = {
+            room_type: tuple(
+                (w_co2 * co2_factor, w_time * time_factor)
+                for co2_factor, time_factor in zip(lut, self._time_lut, strict=True)
+            )
+            for room_type, lut in self._co2_lut.items()
+        }
+        self._default_static_no_co2: tuple[tuple[float, float], ...] = tuple(
+            (w_co2 * _DEFAULT_PATTERN_FACTOR, w_time * time_factor)
+            for time_factor in self._time_lut
         )
-        self.time_low: float = time_factors.get("low", DEFAULT_TIME_FACTORS["low"])
 
-        # Room time patterns
-        self.room_patterns: dict[str, Any] = advanced.get(
-            CONF_ROOM_TIME_PATTERNS,
-            DEFAULT_ROOM_TIME_PATTERNS,
+        # Array forms of the lookup tables for the batch path. The last row of
+        # the static table is used for unknown room types.
+        self._room_type_index: dict[str, int] = {
+            room_type: index for index, room_type in enumerate(self._static_no_co2)
+        }
+        self._temp_params_array: np.ndarray = np.array(self._temp_params)
+        self._weights_no_co2_array: np.ndarray = np.array(self._weights_no_co2)
+        self._weights_with_co2_array: np.ndarray = np.array(self._weights_with_co2)
+        self._time_lut_array: np.ndarray = np.array(self._time_lut)
+        self._static_no_co2_array: np.ndarray = np.array(
+            [*self._static_no_co2.values(), self._default_static_no_co2],
         )
 
+    @classmethod
+    def get(cls, config: Mapping[str, Any]) -> "VentilationCalculator":
+        """
+        Return a shared calculator for the given configuration.
+
+        Calculators are read-only after construction, so callers passing an
+        equal configuration reuse the same instance.
+        """
+        try:
+            frozen = _freeze_config(config)
+            hash(frozen)
+        except TypeError:
+            # Unhashable configuration values cannot key the cache
+            return cls(config)
+        return _build_calculator(frozen)
+
     def calculate_room_score(self, room_data: RoomData) -> float:
         """
         Calculate ventilation score for a room.
@@ -195,8 +420,9 @@ class VentilationCalculator:
         co2 = room_data.co2
 
         # Calculate absolute humidity
-        ah_in = self._calculate_absolute_humidity(humidity_in, temp_in)
-        ah_out = self._calculate_absolute_humidity(humidity_out, temp_out)
+        calculate_absolute_humidity = self._calculate_absolute_humidity
+        ah_in = calculate_absolute_humidity(humidity_in, temp_in)
+        ah_out = calculate_absolute_humidity(humidity_out, temp_out)
 
         # Temperature factor
         temp_diff = temp_in - temp_out
@@ -205,74 +431,164 @@ class VentilationCalculator:
         # Humidity factor
         f_rh = self._calculate_humidity_factor(ah_in, ah_out)
 
-        # CO2 factor
-        f_co2 = self._calculate_co2_factor(room_type, hour, co2)
-
-        # Time factor
-        f_time = self._calculate_time_factor(hour)
-
         # Wind factor
-        enable_wind = self.config.get("enable_wind_factor", True)
-        f_w = self._calculate_wind_factor(wind_speed, enable_wind=enable_wind)
+        f_w = self._wind_fn(wind_speed)
 
-        # Final calculation
+        # Weighted CO2 and time factors; without a CO2 sensor both depend only
+        # on room type and hour and come precomputed
         if co2 is None:
-            score = (
-                self.weight_temp * f_t
-                + self.weight_humidity * f_rh
-                + self.weight_co2 * f_co2
-                + self.weight_time * f_time
-                + f_w
-            )
+            w_t, w_rh, _, _ = self._weights_no_co2
+            co2_term, time_term = self._static_no_co2.get(
+                room_type,
+                self._default_static_no_co2,
+            )[_hour_slot(hour)]
         else:
-            score = (
-                self.weight_temp_with_co2 * f_t
-                + self.weight_humidity_with_co2 * f_rh
-                + self.weight_co2_with_sensor * f_co2
-                + self.weight_time_with_co2 * f_time
-                + f_w
-            )
+            w_t, w_rh, w_co2, w_time = self._weights_with_co2
+            co2_term = w_co2 * self._calculate_co2_factor(room_type, hour, co2)
+            time_term = w_time * self._calculate_time_factor(hour)
+
+        # Final calculation, summed left to right like the weighted factors
+        score = w_t * f_t + w_rh * f_rh + co2_term + time_term + f_w
 
         return round(score, 2)
 
+    def calculate_room_scores_batch(self, rooms: Sequence[RoomData]) -> list[float]:
+        """
+        Calculate ventilation scores for several rooms in one pass.
+
+        The factor cascades are evaluated on NumPy arrays instead of once per
+        room. Results match calling ``calculate_room_score`` for each room,
+        in the same order.
+        """
+        count = len(rooms)
+        if not count:
+            return []
+
+        temp_in, humidity_in, temp_out, humidity_out, wind_speed = np.array(
+            list(map(_ROOM_READINGS, rooms)),
+            dtype=np.float64,
+        ).T
+        hour, month = np.array(list(map(_ROOM_SCHEDULE, rooms)), dtype=np.intp).T
+        hour = np.where((hour >= 0) & (hour < _OFF_PEAK_SLOT), hour, _OFF_PEAK_SLOT)
+        month = np.where(
+            (month >= _MONTHS.start) & (month < _MONTHS.stop),
+            month,
+            _DEFAULT_MONTH_SLOT,
+        )
+        room_type_index = np.fromiter(
+            (
+                self._room_type_index.get(room.room_type, len(self._room_type_index))
+                for room in rooms
+            ),
+            dtype=np.intp,
+            count=count,
+        )
+        co2 = np.fromiter(
+            (np.nan if room.co2 is None else room.co2 for room in rooms),
+            dtype=np.float64,
+            count=count,
+        )
+        has_co2 = ~np.isnan(co2)
+
+        # Absolute humidity
+        ah_in = self._absolute_humidity_array(humidity_in, temp_in)
+        # Rooms usually share the outdoor sensors, so evaluate each distinct
+        # outdoor reading once and scatter the results back to the rooms
+        outdoor, outdoor_index = np.unique(
+            np.stack([humidity_out, temp_out], axis=1),
+            axis=0,
+            return_inverse=True,
+        )
+        ah_out = self._absolute_humidity_array(outdoor[:, 0], outdoor[:, 1])[
+            outdoor_index.reshape(-1)
+        ]
+
+        # Temperature factor
+        temp_diff = temp_in - temp_out
+        good, good_value, moderate, moderate_value = self._temp_params_array[month].T
+        f_t = np.where(
+            temp_diff > good,
+            good_value,
+            np.where(temp_diff > moderate, moderate_value, 0.0),
+        )
+
+        # Humidity factor
+        ah_diff = ah_in - ah_out
+        f_rh = np.where(
+            ah_diff > self.humidity_good,
+            1.0,
+            np.where(ah_diff > self.humidity_moderate, 0.5, 0.0),
+        )
+
+        # Weighted CO2 and time factors, precomputed for rooms without a sensor
+        _, _, w_co2, w_time = self._weights_with_co2
+        f_co2 = np.select(
+            [co2 > self.co2_very_poor, co2 > self.co2_poor, co2 > self.co2_moderate],
+            [1.0, 0.7, 0.3],
+            0.0,
+        )
+        static_co2_term, static_time_term = self._static_no_co2_array[
+            room_type_index,
+            hour,
+        ].T
+        co2_term = np.where(has_co2, w_co2 * f_co2, static_co2_term)
+        time_term = np.where(
+            has_co2,
+            w_time * self._time_lut_array[hour],
+            static_time_term,
+        )
+
+        # Wind factor
+        if self._enable_wind:
+            f_w = np.where(
+                wind_speed < self.wind_no_effect,
+                0.0,
+                np.where(wind_speed < self.wind_moderate_effect, -0.2, -0.5),
+            )
+        else:
+            f_w = np.zeros(count)
+
+        # Final calculation, picking the weight row per room by CO2 presence
+        factors = np.stack([f_t, f_rh], axis=1)
+        weights = np.where(
+            has_co2[:, np.newaxis],
+            self._weights_with_co2_array[:2],
+            self._weights_no_co2_array[:2],
+        )
+        scores = np.einsum("ni,ni->n", weights, factors) + co2_term + time_term + f_w
+
+        # Python's round() keeps the rounding identical to the scalar path
+        return [round(score, 2) for score in scores.tolist()]
+
+    @staticmethod
+    def _absolute_humidity_array(
+        humidity_percent: np.ndarray,
+        temp_celsius: np.ndarray,
+    ) -> np.ndarray:
+        """Calculate absolute humidity in g/m³ for arrays of readings."""
+        return (
+            humidity_percent
+            * _ABS_HUMIDITY_K
+            * np.exp(_MAGNUS_A * temp_celsius / (temp_celsius + _MAGNUS_B))
+            / (_ABS_ZERO + temp_celsius)
+        )
+
     def _calculate_absolute_humidity(
         self,
         humidity_percent: float,
         temp_celsius: float,
     ) -> float:
         """Calculate absolute humidity in g/m³."""
-        saturation_vapor_pressure = 6.112 * math.exp(
-            (17.67 * temp_celsius) / (temp_celsius + 243.5),
-        )
-        return (
-            (humidity_percent / 100)
-            * saturation_vapor_pressure
-            * 2.1674
-            / (273.15 + temp_celsius)
-            * 100
-        )
+        return _absolute_humidity(humidity_percent, temp_celsius)
 
     def _calculate_temperature_factor(self, temp_diff: float, month: int) -> float:
         """Calculate temperature factor based on season."""
-        winter_months = self.config.get("winter_months", [12, 1, 2])
-        summer_months = self.config.get("summer_months", [6, 7, 8])
-
-        if month in winter_months:
-            return (
-                0.8
-                if temp_diff > self.temp_winter_good
-                else (0.4 if temp_diff > self.temp_winter_moderate else 0)
-            )
-        if month in summer_months:
-            return (
-                0.8
-                if temp_diff > self.temp_summer_good
-                else (0.3 if temp_diff > self.temp_summer_moderate else 0)
-            )
+        params = self._temp_params[_month_slot(month)]
+        good, good_value, moderate, moderate_value = params
         return (
-            0.6
-            if temp_diff > self.temp_default_good
-            else (0.3 if temp_diff > self.temp_default_moderate else 0)
+            good_value
+            if temp_diff > good
+            else (moderate_value if temp_diff > moderate else 0)
         )
 
     def _calculate_humidity_factor(self, ah_in: float, ah_out: float) -> float:
@@ -301,38 +617,11 @@ class VentilationCalculator:
             return 0
 
         # Use room type and time-based patterns when no CO2 sensor
-        patterns = {
-            ROOM_TYPE_BEDROOM: 0.8 if hour in [6, 7, 8, 9, 21, 22, 23] else 0.2,
-            ROOM_TYPE_BATHROOM: (
-                0.7 if hour in [6, 7, 8, 9, 18, 19, 20, 21, 22] else 0.3
-            ),
-            ROOM_TYPE_OFFICE: (
-                0.8 if hour in [8, 9, 10, 11, 12, 13, 14, 15, 16, 17] else 0.2
-            ),
-            ROOM_TYPE_KITCHEN: (
-                0.8
-                if hour in [6, 7, 8]
-                else (0.9 if hour in [11, 12, 13, 17, 18, 19, 20] else 0.3)
-            ),
-            ROOM_TYPE_LIVING_ROOM: (
-                0.7
-                if hour in [6, 7, 8, 9]
-                else (
-                    0.6
-                    if hour in [17, 18, 19, 20, 21, 22]
-                    else (0.3 if hour in [10, 11, 12, 13, 14, 15, 16] else 0.2)
-                )
-            ),
-        }
-        return patterns.get(room_type, 0.2)
+        return self._co2_lut.get(room_type, self._default_co2_lut)[_hour_slot(hour)]
 
     def _calculate_time_factor(self, hour: int) -> float:
         """Calculate time factor based on hour."""
-        return (
-            0.8
-            if hour in [7, 8, 9, 18, 19, 20]
-            else (0.5 if hour in [6, 10, 11, 16, 17, 21] else 0.2)
-        )
+        return self._time_lut[_hour_slot(hour)]
 
     def _calculate_wind_factor(
         self,
@@ -348,3 +637,33 @@ class VentilationCalculator:
             if wind_speed < self.wind_no_effect
             else (-0.2 if wind_speed < self.wind_moderate_effect else -0.5)
         )
+
+
+def _freeze_config(value: Any) -> Hashable:
+    """Return a hashable form of a configuration value, tagged by container."""
+    if isinstance(value, Mapping):
+        return dict, frozenset(
+            (key, _freeze_config(item)) for key, item in value.items()
+        )
+    if isinstance(value, (list, tuple)):
+        # Tagged with the type so a list and a tuple map to different keys
+        return type(value), tuple(_freeze_config(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return type(value), frozenset(_freeze_config(item) for item in value)
+    return value
+
+
+def _thaw_config(frozen: Hashable) -> Any:
+    """Rebuild a configuration value from its frozen form, mappings read-only."""
+    if not isinstance(frozen, tuple):
+        return frozen
+    kind, items = frozen
+    if kind is dict:
+        return MappingProxyType({key: _thaw_config(item) for key, item in items})
+    return kind(_thaw_config(item) for item in items)
+
+
+@lru_cache(maxsize=32)
+def _build_calculator(frozen: Hashable) -> VentilationCalculator:
+    """Build the shared calculator for a frozen configuration."""
+    return VentilationCalculator(_thaw_config(frozen))
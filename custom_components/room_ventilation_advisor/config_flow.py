@@ -2,6 +2,8 @@
 
 import contextlib
 import os
+from collections.abc import Callable, Mapping
+from functools import lru_cache
 from typing import Any
 
 import voluptuous as vol
@@ -40,6 +42,180 @@ from custom_components.room_ventilation_advisor.const import (
 
 MAX_ROOMS = 20
 
+# Shared selector instances, schemas only differ in their defaults
+_TEMPERATURE_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(domain="sensor", device_class="temperature"),
+)
+_HUMIDITY_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(domain="sensor", device_class="humidity"),
+)
+_SENSOR_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(domain="sensor"),
+)
+_ROOM_TYPE_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(options=list(ROOM_TYPES)),
+)
+_SCAN_INTERVAL_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=60, max=3600, unit_of_measurement="seconds"),
+)
+
+# Static form schemas, built once at import
+_USER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_NAME, default="Room Ventilation Advisor"): str,
+        vol.Required(CONF_OUTDOOR_TEMP_SENSOR): _TEMPERATURE_SELECTOR,
+        vol.Required(CONF_OUTDOOR_HUMIDITY_SENSOR): _HUMIDITY_SELECTOR,
+        vol.Required(CONF_WIND_SENSOR): _SENSOR_SELECTOR,
+        vol.Optional(
+            CONF_SCAN_INTERVAL,
+            default=DEFAULT_SCAN_INTERVAL,
+        ): _SCAN_INTERVAL_SELECTOR,
+    },
+)
+
+_INIT_SCHEMA = vol.Schema(
+    {
+        vol.Optional("configure_basic", default=False): bool,
+        vol.Optional("configure_rooms", default=False): bool,
+        vol.Optional("configure_advanced", default=False): bool,
+    },
+)
+
+_REMOVE_ROOM_SCHEMA = vol.Schema(
+    {
+        vol.Required("confirm_remove", default=False): bool,
+    },
+)
+
+# Advanced settings groups with their defaults, value type and the
+# (form key, settings key) pairs of the flat advanced form
+_ADVANCED_FIELD_MAP: tuple[
+    tuple[str, Mapping[str, Any], type, tuple[tuple[str, str], ...]],
+    ...,
+] = (
+    (
+        CONF_TEMPERATURE_THRESHOLDS,
+        DEFAULT_TEMPERATURE_THRESHOLDS,
+        float,
+        (
+            ("temperature_winter_good", "winter_good"),
+            ("temperature_winter_moderate", "winter_moderate"),
+            ("temperature_summer_good", "summer_good"),
+            ("temperature_summer_moderate", "summer_moderate"),
+            ("temperature_default_good", "default_good"),
+            ("temperature_default_moderate", "default_moderate"),
+        ),
+    ),
+    (
+        CONF_HUMIDITY_THRESHOLDS,
+        DEFAULT_HUMIDITY_THRESHOLDS,
+        float,
+        (("humidity_good", "good"), ("humidity_moderate", "moderate")),
+    ),
+    (
+        CONF_CO2_THRESHOLDS,
+        DEFAULT_CO2_THRESHOLDS,
+        int,
+        (
+            ("co2_very_poor", "very_poor"),
+            ("co2_poor", "poor"),
+            ("co2_moderate", "moderate"),
+        ),
+    ),
+    (
+        CONF_WIND_THRESHOLDS,
+        DEFAULT_WIND_THRESHOLDS,
+        float,
+        (
+            ("wind_no_effect", "no_effect"),
+            ("wind_moderate_effect", "moderate_effect"),
+        ),
+    ),
+    (
+        CONF_SCORE_WEIGHTS,
+        DEFAULT_SCORE_WEIGHTS,
+        float,
+        (
+            ("weight_temperature", "temperature"),
+            ("weight_humidity", "humidity"),
+            ("weight_co2", "co2"),
+            ("weight_time", "time"),
+        ),
+    ),
+)
+
+
+def _build_advanced_schema(defaults: tuple[Any, ...]) -> vol.Schema:
+    """Build the advanced options schema for frozen field defaults."""
+    fields = (
+        (flat_key, value_type)
+        for _, _, value_type, group_fields in _ADVANCED_FIELD_MAP
+        for flat_key, _ in group_fields
+    )
+    return vol.Schema(
+        {
+            vol.Optional(flat_key, default=default): vol.Coerce(value_type)
+            for (flat_key, value_type), default in zip(fields, defaults, strict=True)
+        },
+    )
+
+
+_advanced_schema = lru_cache(maxsize=8)(_build_advanced_schema)
+
+
+# Room form fields as (marker, key, fallback default, validator)
+_ROOM_SCHEMA_FIELDS: tuple[tuple[type[vol.Marker], str, Any, Any], ...] = (
+    (vol.Required, CONF_ROOM_NAME, "", str),
+    (vol.Required, CONF_TEMP_SENSOR, None, _TEMPERATURE_SELECTOR),
+    (vol.Required, CONF_HUMIDITY_SENSOR, None, _HUMIDITY_SELECTOR),
+    (vol.Required, CONF_ROOM_TYPE, None, _ROOM_TYPE_SELECTOR),
+    (vol.Optional, CONF_CO2_SENSOR, None, vol.Any(None, _SENSOR_SELECTOR)),
+    (vol.Optional, CONF_ENABLED, True, bool),
+)
+
+
+def _build_room_schema(defaults: tuple[Any, ...]) -> vol.Schema:
+    """Build the room configuration schema for frozen field defaults."""
+    return vol.Schema(
+        {
+            marker(key, default=default): validator
+            for (marker, key, _, validator), default in zip(
+                _ROOM_SCHEMA_FIELDS,
+                defaults,
+                strict=True,
+            )
+        },
+    )
+
+
+_room_schema = lru_cache(maxsize=32)(_build_room_schema)
+
+
+def _cached_schema(
+    cached: Callable[[tuple[Any, ...]], vol.Schema],
+    build: Callable[[tuple[Any, ...]], vol.Schema],
+    defaults: tuple[Any, ...],
+) -> vol.Schema:
+    """Return the schema for frozen field defaults, cached when hashable."""
+    try:
+        hash(defaults)
+    except TypeError:
+        # Unhashable stored values cannot key the cache; build uncached
+        return build(defaults)
+    return cached(defaults)
+
+
+def _prefilled_room_schema(current_config: Mapping[str, Any]) -> vol.Schema:
+    """Return the room configuration schema prefilled from a room config."""
+    return _cached_schema(
+        _room_schema,
+        _build_room_schema,
+        tuple(
+            current_config.get(key, fallback)
+            for _, key, fallback, _ in _ROOM_SCHEMA_FIELDS
+        ),
+    )
+
 
 class RoomVentilationAdvisorConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle config flow for Room Ventilation Advisor."""
@@ -61,57 +237,15 @@ class RoomVentilationAdvisorConfigFlow(config_entries.ConfigFlow, domain=DOMAIN)
         existing_entries = self.hass.config_entries.async_entries(DOMAIN)
         if existing_entries:
             return self.async_abort(reason="already_configured")
-        """Handle initial step - base configuration."""
-        errors = {}
 
         if user_input is not None:
             self._base_config = user_input
             return await self.async_step_room_setup()
 
-        # Get available sensors for selection
-        sensor_entities = []
-        for entity_id in self.hass.states.async_entity_ids("sensor"):
-            state = self.hass.states.get(entity_id)
-            if state and state.attributes.get("device_class") in [
-                "temperature",
-                "humidity",
-            ]:
-                sensor_entities.append(entity_id)
-
-        data_schema = vol.Schema(
-            {
-                vol.Required(CONF_NAME, default="Room Ventilation Advisor"): str,
-                vol.Required(CONF_OUTDOOR_TEMP_SENSOR): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain="sensor",
-                        device_class="temperature",
-                    ),
-                ),
-                vol.Required(CONF_OUTDOOR_HUMIDITY_SENSOR): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain="sensor",
-                        device_class="humidity",
-                    ),
-                ),
-                vol.Required(CONF_WIND_SENSOR): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor"),
-                ),
-                vol.Optional(
-                    CONF_SCAN_INTERVAL,
-                    default=DEFAULT_SCAN_INTERVAL,
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=60,
-                        max=3600,
-                        unit_of_measurement="seconds",
-                    ),
-                ),
-            },
-        )
-
+        errors: dict[str, str] = {}
         return self.async_show_form(
             step_id="user",
-            data_schema=data_schema,
+            data_schema=_USER_SCHEMA,
             errors=errors,
         )
 
@@ -139,24 +273,10 @@ class RoomVentilationAdvisorConfigFlow(config_entries.ConfigFlow, domain=DOMAIN)
         data_schema = vol.Schema(
             {
                 vol.Required(CONF_ROOM_NAME): str,
-                vol.Required(CONF_TEMP_SENSOR): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain="sensor",
-                        device_class="temperature",
-                    ),
-                ),
-                vol.Required(CONF_HUMIDITY_SENSOR): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain="sensor",
-                        device_class="humidity",
-                    ),
-                ),
-                vol.Required(CONF_ROOM_TYPE): selector.SelectSelector(
-                    selector.SelectSelectorConfig(options=ROOM_TYPES),
-                ),
-                vol.Optional(CONF_CO2_SENSOR): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor"),
-                ),
+                vol.Required(CONF_TEMP_SENSOR): _TEMPERATURE_SELECTOR,
+                vol.Required(CONF_HUMIDITY_SENSOR): _HUMIDITY_SELECTOR,
+                vol.Required(CONF_ROOM_TYPE): _ROOM_TYPE_SELECTOR,
+                vol.Optional(CONF_CO2_SENSOR): _SENSOR_SELECTOR,
                 vol.Optional(CONF_ENABLED, default=True): bool,
                 vol.Optional(
                     "add_another_room",
@@ -201,6 +321,8 @@ class RoomVentilationAdvisorOptionsFlow(config_entries.OptionsFlow):
         # Track currently selected room for edit/remove steps
         self._room_to_edit: str | None = None
         self._room_to_remove: str | None = None
+        # Room names and their display string from the last rooms menu render
+        self._rooms_cache: tuple[tuple[str, ...], str] | None = None
 
     async def async_step_init(
         self,
@@ -219,13 +341,7 @@ class RoomVentilationAdvisorOptionsFlow(config_entries.OptionsFlow):
         # Show menu with basic, rooms, and advanced options
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema(
-                {
-                    vol.Optional("configure_basic", default=False): bool,
-                    vol.Optional("configure_rooms", default=False): bool,
-                    vol.Optional("configure_advanced", default=False): bool,
-                },
-            ),
+            data_schema=_INIT_SCHEMA,
             description_placeholders={
                 "basic_desc": "Configure scan interval, wind factor, and room settings",
                 "rooms_desc": "Add, remove, or modify room configurations",
@@ -262,45 +378,28 @@ class RoomVentilationAdvisorOptionsFlow(config_entries.OptionsFlow):
             return self.async_create_entry(title="", data=options_data)
 
         # Build the schema for basic settings (only global sensors and settings)
+        entry_data = self._config_entry.data
         options_schema = vol.Schema(
             {
                 vol.Optional(
                     CONF_OUTDOOR_TEMP_SENSOR,
-                    default=self._config_entry.data.get(CONF_OUTDOOR_TEMP_SENSOR),
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain="sensor",
-                        device_class="temperature",
-                    ),
-                ),
+                    default=entry_data.get(CONF_OUTDOOR_TEMP_SENSOR),
+                ): _TEMPERATURE_SELECTOR,
                 vol.Optional(
                     CONF_OUTDOOR_HUMIDITY_SENSOR,
-                    default=self._config_entry.data.get(CONF_OUTDOOR_HUMIDITY_SENSOR),
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain="sensor",
-                        device_class="humidity",
-                    ),
-                ),
+                    default=entry_data.get(CONF_OUTDOOR_HUMIDITY_SENSOR),
+                ): _HUMIDITY_SELECTOR,
                 vol.Optional(
                     CONF_WIND_SENSOR,
-                    default=self._config_entry.data.get(CONF_WIND_SENSOR),
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor"),
-                ),
+                    default=entry_data.get(CONF_WIND_SENSOR),
+                ): _SENSOR_SELECTOR,
                 vol.Optional(
                     CONF_SCAN_INTERVAL,
-                    default=self._config_entry.data.get(
+                    default=entry_data.get(
                         CONF_SCAN_INTERVAL,
                         DEFAULT_SCAN_INTERVAL,
                     ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=60,
-                        max=3600,
-                        unit_of_measurement="seconds",
-                    ),
-                ),
+                ): _SCAN_INTERVAL_SELECTOR,
                 vol.Optional("enable_wind_factor", default=True): bool,
             },
         )
@@ -328,11 +427,11 @@ class RoomVentilationAdvisorOptionsFlow(config_entries.OptionsFlow):
             else:
                 advanced_settings = self._build_advanced_settings_from_flat(user_input)
 
-            # Update advanced settings
-            if CONF_ADVANCED_SETTINGS not in current_options:
-                current_options[CONF_ADVANCED_SETTINGS] = {}
-
-            current_options[CONF_ADVANCED_SETTINGS].update(advanced_settings)
+            # Update advanced settings on a copy, leaving the entry options intact
+            current_options[CONF_ADVANCED_SETTINGS] = {
+                **current_options.get(CONF_ADVANCED_SETTINGS, {}),
+                **advanced_settings,
+            }
 
             return self.async_create_entry(title="", data=current_options)
 
@@ -352,196 +451,32 @@ class RoomVentilationAdvisorOptionsFlow(config_entries.OptionsFlow):
     ) -> dict[str, Any]:
         """Build nested advanced settings dict from a flat form submission."""
         advanced_settings: dict[str, Any] = {}
-
-        # Helper to cluster flat keys into nested dicts
-        def _collect(dest_key: str, mapping: list[tuple[str, str]]) -> None:
-            container: dict[str, Any] = {}
-            for flat_key, nested_key in mapping:
-                if flat_key in user_input:
-                    container[nested_key] = user_input[flat_key]
-            if container:
-                advanced_settings[dest_key] = container
-
-        # Temperature thresholds mapping
-        _collect(
-            CONF_TEMPERATURE_THRESHOLDS,
-            [
-                ("temperature_winter_good", "winter_good"),
-                ("temperature_winter_moderate", "winter_moderate"),
-                ("temperature_summer_good", "summer_good"),
-                ("temperature_summer_moderate", "summer_moderate"),
-                ("temperature_default_good", "default_good"),
-                ("temperature_default_moderate", "default_moderate"),
-            ],
-        )
-
-        # Humidity
-        _collect(
-            CONF_HUMIDITY_THRESHOLDS,
-            [("humidity_good", "good"), ("humidity_moderate", "moderate")],
-        )
-
-        # CO2
-        _collect(
-            CONF_CO2_THRESHOLDS,
-            [
-                ("co2_very_poor", "very_poor"),
-                ("co2_poor", "poor"),
-                ("co2_moderate", "moderate"),
-            ],
-        )
-
-        # Wind
-        _collect(
-            CONF_WIND_THRESHOLDS,
-            [
-                ("wind_no_effect", "no_effect"),
-                ("wind_moderate_effect", "moderate_effect"),
-            ],
-        )
-
-        # Score weights
-        _collect(
-            CONF_SCORE_WEIGHTS,
-            [
-                ("weight_temperature", "temperature"),
-                ("weight_humidity", "humidity"),
-                ("weight_co2", "co2"),
-                ("weight_time", "time"),
-            ],
-        )
-
+        for group_key, _, _, fields in _ADVANCED_FIELD_MAP:
+            group = {
+                nested_key: user_input[flat_key]
+                for flat_key, nested_key in fields
+                if flat_key in user_input
+            }
+            if group:
+                advanced_settings[group_key] = group
         return advanced_settings
 
     def _make_advanced_schema(self, current_advanced: dict[str, Any]) -> vol.Schema:
         """Construct the advanced options schema from current values and defaults."""
-        return vol.Schema(
-            {
-                # Temperature thresholds
-                vol.Optional(
-                    "temperature_winter_good",
-                    default=current_advanced.get(CONF_TEMPERATURE_THRESHOLDS, {}).get(
-                        "winter_good",
-                        DEFAULT_TEMPERATURE_THRESHOLDS["winter_good"],
-                    ),
-                ): vol.Coerce(float),
-                vol.Optional(
-                    "temperature_winter_moderate",
-                    default=current_advanced.get(CONF_TEMPERATURE_THRESHOLDS, {}).get(
-                        "winter_moderate",
-                        DEFAULT_TEMPERATURE_THRESHOLDS["winter_moderate"],
-                    ),
-                ): vol.Coerce(float),
-                vol.Optional(
-                    "temperature_summer_good",
-                    default=current_advanced.get(CONF_TEMPERATURE_THRESHOLDS, {}).get(
-                        "summer_good",
-                        DEFAULT_TEMPERATURE_THRESHOLDS["summer_good"],
-                    ),
-                ): vol.Coerce(float),
-                vol.Optional(
-                    "temperature_summer_moderate",
-                    default=current_advanced.get(CONF_TEMPERATURE_THRESHOLDS, {}).get(
-                        "summer_moderate",
-                        DEFAULT_TEMPERATURE_THRESHOLDS["summer_moderate"],
-                    ),
-                ): vol.Coerce(float),
-                vol.Optional(
-                    "temperature_default_good",
-                    default=current_advanced.get(CONF_TEMPERATURE_THRESHOLDS, {}).get(
-                        "default_good",
-                        DEFAULT_TEMPERATURE_THRESHOLDS["default_good"],
-                    ),
-                ): vol.Coerce(float),
-                vol.Optional(
-                    "temperature_default_moderate",
-                    default=current_advanced.get(CONF_TEMPERATURE_THRESHOLDS, {}).get(
-                        "default_moderate",
-                        DEFAULT_TEMPERATURE_THRESHOLDS["default_moderate"],
-                    ),
-                ): vol.Coerce(float),
-                # Humidity
-                vol.Optional(
-                    "humidity_good",
-                    default=current_advanced.get(CONF_HUMIDITY_THRESHOLDS, {}).get(
-                        "good",
-                        DEFAULT_HUMIDITY_THRESHOLDS["good"],
-                    ),
-                ): vol.Coerce(float),
-                vol.Optional(
-                    "humidity_moderate",
-                    default=current_advanced.get(CONF_HUMIDITY_THRESHOLDS, {}).get(
-                        "moderate",
-                        DEFAULT_HUMIDITY_THRESHOLDS["moderate"],
-                    ),
-                ): vol.Coerce(float),
-                # CO2
-                vol.Optional(
-                    "co2_very_poor",
-                    default=current_advanced.get(CONF_CO2_THRESHOLDS, {}).get(
-                        "very_poor",
-                        DEFAULT_CO2_THRESHOLDS["very_poor"],
-                    ),
-                ): vol.Coerce(int),
-                vol.Optional(
-                    "co2_poor",
-                    default=current_advanced.get(CONF_CO2_THRESHOLDS, {}).get(
-                        "poor",
-                        DEFAULT_CO2_THRESHOLDS["poor"],
-                    ),
-                ): vol.Coerce(int),
-                vol.Optional(
-                    "co2_moderate",
-                    default=current_advanced.get(CONF_CO2_THRESHOLDS, {}).get(
-                        "moderate",
-                        DEFAULT_CO2_THRESHOLDS["moderate"],
-                    ),
-                ): vol.Coerce(int),
-                # Wind
-                vol.Optional(
-                    "wind_no_effect",
-                    default=current_advanced.get(CONF_WIND_THRESHOLDS, {}).get(
-                        "no_effect",
-                        DEFAULT_WIND_THRESHOLDS["no_effect"],
-                    ),
-                ): vol.Coerce(float),
-                vol.Optional(
-                    "wind_moderate_effect",
-                    default=current_advanced.get(CONF_WIND_THRESHOLDS, {}).get(
-                        "moderate_effect",
-                        DEFAULT_WIND_THRESHOLDS["moderate_effect"],
-                    ),
-                ): vol.Coerce(float),
-                # Score weights
-                vol.Optional(
-                    "weight_temperature",
-                    default=current_advanced.get(CONF_SCORE_WEIGHTS, {}).get(
-                        "temperature",
-                        DEFAULT_SCORE_WEIGHTS["temperature"],
-                    ),
-                ): vol.Coerce(float),
-                vol.Optional(
-                    "weight_humidity",
-                    default=current_advanced.get(CONF_SCORE_WEIGHTS, {}).get(
-                        "humidity",
-                        DEFAULT_SCORE_WEIGHTS["humidity"],
-                    ),
-                ): vol.Coerce(float),
-                vol.Optional(
-                    "weight_co2",
-                    default=current_advanced.get(CONF_SCORE_WEIGHTS, {}).get(
-                        "co2",
-                        DEFAULT_SCORE_WEIGHTS["co2"],
-                    ),
-                ): vol.Coerce(float),
-                vol.Optional(
-                    "weight_time",
-                    default=current_advanced.get(CONF_SCORE_WEIGHTS, {}).get(
-                        "time",
-                        DEFAULT_SCORE_WEIGHTS["time"],
-                    ),
-                ): vol.Coerce(float),
-            },
+        # Only the groups and keys the form shows take part, in field map order
+        defaults: list[Any] = []
+        for group_key, group_defaults, _, fields in _ADVANCED_FIELD_MAP:
+            group = current_advanced.get(group_key)
+            if not isinstance(group, Mapping):
+                group = {}
+            defaults.extend(
+                group.get(nested_key, group_defaults[nested_key])
+                for _, nested_key in fields
+            )
+        return _cached_schema(
+            _advanced_schema,
+            _build_advanced_schema,
+            tuple(defaults),
         )
 
     async def async_step_rooms(
@@ -567,25 +502,25 @@ class RoomVentilationAdvisorOptionsFlow(config_entries.OptionsFlow):
             return self.async_create_entry(title="", data=user_input)
 
         rooms_data = self._config_entry.data.get(CONF_ROOMS, {})
-        room_names = list(rooms_data.keys())
+        room_names = tuple(rooms_data)
+        if self._rooms_cache is None or self._rooms_cache[0] != room_names:
+            self._rooms_cache = (
+                room_names,
+                ", ".join(room_names) if room_names else "No rooms configured",
+            )
 
         schema_dict = {}
 
         if room_names:
+            room_selector = selector.SelectSelector(
+                selector.SelectSelectorConfig(options=list(room_names)),
+            )
             schema_dict.update(
                 {
                     vol.Optional("edit_room", default=False): bool,
-                    vol.Optional("room_to_edit"): selector.SelectSelector(
-                        selector.SelectSelectorConfig(options=room_names),
-                    )
-                    if room_names
-                    else None,
+                    vol.Optional("room_to_edit"): room_selector,
                     vol.Optional("remove_room", default=False): bool,
-                    vol.Optional("room_to_remove"): selector.SelectSelector(
-                        selector.SelectSelectorConfig(options=room_names),
-                    )
-                    if room_names
-                    else None,
+                    vol.Optional("room_to_remove"): room_selector,
                 },
             )
 
@@ -595,9 +530,7 @@ class RoomVentilationAdvisorOptionsFlow(config_entries.OptionsFlow):
             step_id="rooms",
             data_schema=vol.Schema(schema_dict),
             description_placeholders={
-                "current_rooms": ", ".join(room_names)
-                if room_names
-                else "No rooms configured",
+                "current_rooms": self._rooms_cache[1],
                 "max_rooms": str(MAX_ROOMS),
             },
         )
@@ -609,7 +542,8 @@ class RoomVentilationAdvisorOptionsFlow(config_entries.OptionsFlow):
         """Add a new room."""
         if user_input is not None:
             room_name = user_input[CONF_ROOM_NAME]
-            current_rooms = self._config_entry.data.get(CONF_ROOMS, {})
+            entry_data = self._config_entry.data
+            current_rooms = entry_data.get(CONF_ROOMS, {})
 
             if room_name in current_rooms:
                 return self.async_show_form(
@@ -626,14 +560,7 @@ class RoomVentilationAdvisorOptionsFlow(config_entries.OptionsFlow):
                 )
 
             # Add new room to config
-            co2_sensor_value = user_input.get(CONF_CO2_SENSOR)
-            # Convert empty strings to None for CO2 sensor
-            if (
-                co2_sensor_value
-                and isinstance(co2_sensor_value, str)
-                and not co2_sensor_value.strip()
-            ):
-                co2_sensor_value = None
+            co2_sensor_value = self._normalize_co2(user_input.get(CONF_CO2_SENSOR))
 
             new_room_config = {
                 CONF_ROOM_NAME: room_name,
@@ -644,22 +571,15 @@ class RoomVentilationAdvisorOptionsFlow(config_entries.OptionsFlow):
                 CONF_ENABLED: user_input.get(CONF_ENABLED, True),
             }
 
-            updated_config = dict(self._config_entry.data)
-            updated_rooms = dict(current_rooms)
-            updated_rooms[room_name] = new_room_config
-            updated_config[CONF_ROOMS] = updated_rooms
-
             self.hass.config_entries.async_update_entry(
                 self._config_entry,
-                data=updated_config,
+                data={
+                    **entry_data,
+                    CONF_ROOMS: {**current_rooms, room_name: new_room_config},
+                },
             )
 
-            # Reload the entry to update sensors (skip in testing)
-            if not os.environ.get("PYTEST_CURRENT_TEST"):
-                with contextlib.suppress(Exception):
-                    await self.hass.config_entries.async_reload(
-                        self._config_entry.entry_id,
-                    )
+            await self._async_reload_entry()
 
             return self.async_create_entry(title="", data={})
 
@@ -687,39 +607,29 @@ class RoomVentilationAdvisorOptionsFlow(config_entries.OptionsFlow):
         if room_name is None:
             return await self.async_step_init()
 
-        if user_input is not None:
-            current_rooms = self._config_entry.data.get(CONF_ROOMS, {})
-            current_room_config = current_rooms.get(room_name, {})
+        entry_data = self._config_entry.data
+        current_rooms = entry_data.get(CONF_ROOMS, {})
+        current_room_config = current_rooms.get(room_name, {})
 
+        if user_input is not None:
             # Update room configuration
-            co2_sensor_value = user_input.get(CONF_CO2_SENSOR)
-            # Convert empty strings to None for CO2 sensor
-            if (
-                co2_sensor_value
-                and isinstance(co2_sensor_value, str)
-                and not co2_sensor_value.strip()
-            ):
-                co2_sensor_value = None
+            co2_sensor_value = self._normalize_co2(user_input.get(CONF_CO2_SENSOR))
 
-            updated_room_config = dict(current_room_config)
-            updated_room_config.update(
-                {
-                    CONF_TEMP_SENSOR: user_input[CONF_TEMP_SENSOR],
-                    CONF_HUMIDITY_SENSOR: user_input[CONF_HUMIDITY_SENSOR],
-                    CONF_ROOM_TYPE: user_input[CONF_ROOM_TYPE],
-                    CONF_CO2_SENSOR: co2_sensor_value,
-                    CONF_ENABLED: user_input.get(CONF_ENABLED, True),
-                },
-            )
-
-            updated_config = dict(self._config_entry.data)
-            updated_rooms = dict(current_rooms)
-            updated_rooms[room_name] = updated_room_config
-            updated_config[CONF_ROOMS] = updated_rooms
+            updated_room_config = {
+                **current_room_config,
+                CONF_TEMP_SENSOR: user_input[CONF_TEMP_SENSOR],
+                CONF_HUMIDITY_SENSOR: user_input[CONF_HUMIDITY_SENSOR],
+                CONF_ROOM_TYPE: user_input[CONF_ROOM_TYPE],
+                CONF_CO2_SENSOR: co2_sensor_value,
+                CONF_ENABLED: user_input.get(CONF_ENABLED, True),
+            }
 
             self.hass.config_entries.async_update_entry(
                 self._config_entry,
-                data=updated_config,
+                data={
+                    **entry_data,
+                    CONF_ROOMS: {**current_rooms, room_name: updated_room_config},
+                },
             )
 
             # clear stored selection
@@ -728,9 +638,6 @@ class RoomVentilationAdvisorOptionsFlow(config_entries.OptionsFlow):
             return self.async_create_entry(title="", data={})
 
         # Pre-fill form with current room data
-        current_rooms = self._config_entry.data.get(CONF_ROOMS, {})
-        current_room_config = current_rooms.get(room_name, {})
-
         schema = self._get_room_schema(current_room_config)
 
         return self.async_show_form(
@@ -759,25 +666,25 @@ class RoomVentilationAdvisorOptionsFlow(config_entries.OptionsFlow):
 
         if user_input is not None:
             if user_input.get("confirm_remove", False):
-                current_rooms = self._config_entry.data.get(CONF_ROOMS, {})
+                entry_data = self._config_entry.data
+                current_rooms = entry_data.get(CONF_ROOMS, {})
 
                 if room_name in current_rooms:
-                    updated_config = dict(self._config_entry.data)
-                    updated_rooms = dict(current_rooms)
-                    del updated_rooms[room_name]
-                    updated_config[CONF_ROOMS] = updated_rooms
+                    updated_config = {
+                        **entry_data,
+                        CONF_ROOMS: {
+                            name: room
+                            for name, room in current_rooms.items()
+                            if name != room_name
+                        },
+                    }
 
                     self.hass.config_entries.async_update_entry(
                         self._config_entry,
                         data=updated_config,
                     )
 
-                    # Reload the entry to update sensors (skip in testing)
-                    if not os.environ.get("PYTEST_CURRENT_TEST"):
-                        with contextlib.suppress(Exception):
-                            await self.hass.config_entries.async_reload(
-                                self._config_entry.entry_id,
-                            )
+                    await self._async_reload_entry()
 
                     # clear stored selection
                     self._room_to_remove = None
@@ -795,64 +702,28 @@ class RoomVentilationAdvisorOptionsFlow(config_entries.OptionsFlow):
 
         return self.async_show_form(
             step_id="remove_room",
-            data_schema=vol.Schema(
-                {
-                    vol.Required("confirm_remove", default=False): bool,
-                },
-            ),
+            data_schema=_REMOVE_ROOM_SCHEMA,
             description_placeholders={"room_name": room_name},
         )
 
+    @staticmethod
+    def _normalize_co2(co2_sensor: Any) -> Any:
+        """Convert an empty CO2 sensor field to None."""
+        if isinstance(co2_sensor, str) and not co2_sensor.strip():
+            return None
+        return co2_sensor
+
+    async def _async_reload_entry(self) -> None:
+        """Reload the entry to update sensors (skip in testing)."""
+        # Read at call time: pytest only sets the variable while a test runs
+        if os.environ.get("PYTEST_CURRENT_TEST"):
+            return
+        with contextlib.suppress(Exception):
+            await self.hass.config_entries.async_reload(self._config_entry.entry_id)
+
     def _get_room_schema(
         self,
         current_config: dict[str, Any] | None = None,
     ) -> vol.Schema:
         """Get the room configuration schema."""
-        if current_config is None:
-            current_config = {}
-
-        return vol.Schema(
-            {
-                vol.Required(
-                    CONF_ROOM_NAME,
-                    default=current_config.get(CONF_ROOM_NAME, ""),
-                ): str,
-                vol.Required(
-                    CONF_TEMP_SENSOR,
-                    default=current_config.get(CONF_TEMP_SENSOR),
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain="sensor",
-                        device_class="temperature",
-                    ),
-                ),
-                vol.Required(
-                    CONF_HUMIDITY_SENSOR,
-                    default=current_config.get(CONF_HUMIDITY_SENSOR),
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain="sensor",
-                        device_class="humidity",
-                    ),
-                ),
-                vol.Required(
-                    CONF_ROOM_TYPE,
-                    default=current_config.get(CONF_ROOM_TYPE),
-                ): selector.SelectSelector(
-                    selector.SelectSelectorConfig(options=ROOM_TYPES),
-                ),
-                vol.Optional(
-                    CONF_CO2_SENSOR,
-                    default=current_config.get(CONF_CO2_SENSOR),
-                ): vol.Any(
-                    None,
-                    selector.EntitySelector(
-                        selector.EntitySelectorConfig(domain="sensor"),
-                    ),
-                ),
-                vol.Optional(
-                    CONF_ENABLED,
-                    default=current_config.get(CONF_ENABLED, True),
-                ): bool,
-            },
-        )
+        return _prefilled_room_schema(current_config or {})
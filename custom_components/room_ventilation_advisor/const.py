@@ -1,5 +1,6 @@
 """Constants for Room Ventilation Advisor integration."""
 
+from types import MappingProxyType
 from typing import Final
 
 DOMAIN: Final = "room_ventilation_advisor"
@@ -28,56 +29,66 @@ ROOM_TYPE_BATHROOM: Final = "bathroom"
 ROOM_TYPE_KITCHEN: Final = "kitchen"
 ROOM_TYPE_OFFICE: Final = "office"
 
-ROOM_TYPES: Final = [
+ROOM_TYPES: Final = (
     ROOM_TYPE_LIVING_ROOM,
     ROOM_TYPE_BEDROOM,
     ROOM_TYPE_BATHROOM,
     ROOM_TYPE_KITCHEN,
     ROOM_TYPE_OFFICE,
-]
+)
 
 # Default values
 DEFAULT_SCAN_INTERVAL: Final = 300
 DEFAULT_ENABLE_WIND_FACTOR: Final = True
-DEFAULT_WINTER_MONTHS: Final = [12, 1, 2]
-DEFAULT_SUMMER_MONTHS: Final = [6, 7, 8]
-
-# Ventilation calculation defaults
-DEFAULT_TEMPERATURE_THRESHOLDS: Final = {
-    "winter_good": 2.0,  # °C temperature difference for good ventilation
-    "winter_moderate": 0.0,  # °C temperature difference for moderate ventilation
-    "summer_good": 3.0,  # °C temperature difference for good ventilation
-    "summer_moderate": 0.0,  # °C temperature difference for moderate ventilation
-    "default_good": 1.0,  # °C temperature difference for good ventilation
-    "default_moderate": -2.0,  # °C temperature difference for moderate ventilation
-}
-
-DEFAULT_HUMIDITY_THRESHOLDS: Final = {
-    "good": 1.0,  # g/m³ absolute humidity difference for good ventilation
-    "moderate": 0.0,  # g/m³ absolute humidity difference for moderate ventilation
-}
+DEFAULT_WINTER_MONTHS: Final = (12, 1, 2)
+DEFAULT_SUMMER_MONTHS: Final = (6, 7, 8)
+
+# Ventilation calculation defaults, read-only so callers can share them
+DEFAULT_TEMPERATURE_THRESHOLDS: Final = MappingProxyType(
+    {
+        "winter_good": 2.0,  # °C temperature difference for good ventilation
+        "winter_moderate": 0.0,  # °C temperature difference for moderate ventilation
+        "summer_good": 3.0,  # °C temperature difference for good ventilation
+        "summer_moderate": 0.0,  # °C temperature difference for moderate ventilation
+        "default_good": 1.0,  # °C temperature difference for good ventilation
+        "default_moderate": -2.0,  # °C temperature difference for moderate ventilation
+    },
+)
 
-DEFAULT_CO2_THRESHOLDS: Final = {
-    "very_poor": 1200,  # ppm CO2 level for very poor air quality
-    "poor": 1000,  # ppm CO2 level for poor air quality
-    "moderate": 800,  # ppm CO2 level for moderate air quality
-}
+DEFAULT_HUMIDITY_THRESHOLDS: Final = MappingProxyType(
+    {
+        "good": 1.0,  # g/m³ absolute humidity difference for good ventilation
+        "moderate": 0.0,  # g/m³ absolute humidity difference for moderate ventilation
+    },
+)
 
-DEFAULT_WIND_THRESHOLDS: Final = {
-    "no_effect": 15.0,  # m/s wind speed with no ventilation effect
-    "moderate_effect": 25.0,  # m/s wind speed with moderate negative effect
-}
+DEFAULT_CO2_THRESHOLDS: Final = MappingProxyType(
+    {
+        "very_poor": 1200,  # ppm CO2 level for very poor air quality
+        "poor": 1000,  # ppm CO2 level for poor air quality
+        "moderate": 800,  # ppm CO2 level for moderate air quality
+    },
+)
 
-DEFAULT_SCORE_WEIGHTS: Final = {
-    "temperature": 0.35,  # Weight for temperature factor (without CO2)
-    "humidity": 0.35,  # Weight for humidity factor (without CO2)
-    "co2": 0.2,  # Weight for CO2 factor (without CO2)
-    "time": 0.1,  # Weight for time factor (without CO2)
-    "temperature_with_co2": 0.25,  # Weight for temperature factor (with CO2)
-    "humidity_with_co2": 0.25,  # Weight for humidity factor (with CO2)
-    "co2_with_sensor": 0.35,  # Weight for CO2 factor (with CO2)
-    "time_with_co2": 0.15,  # Weight for time factor (with CO2)
-}
+DEFAULT_WIND_THRESHOLDS: Final = MappingProxyType(
+    {
+        "no_effect": 15.0,  # m/s wind speed with no ventilation effect
+        "moderate_effect": 25.0,  # m/s wind speed with moderate negative effect
+    },
+)
+
+DEFAULT_SCORE_WEIGHTS: Final = MappingProxyType(
+    {
+        "temperature": 0.35,  # Weight for temperature factor (without CO2)
+        "humidity": 0.35,  # Weight for humidity factor (without CO2)
+        "co2": 0.2,  # Weight for CO2 factor (without CO2)
+        "time": 0.1,  # Weight for time factor (without CO2)
+        "temperature_with_co2": 0.25,  # Weight for temperature factor (with CO2)
+        "humidity_with_co2": 0.25,  # Weight for humidity factor (with CO2)
+        "co2_with_sensor": 0.35,  # Weight for CO2 factor (with CO2)
+        "time_with_co2": 0.15,  # Weight for time factor (with CO2)
+    },
+)
 
 DEFAULT_TIME_FACTORS: Final = {
     "high": [7, 8, 9, 18, 19, 20],  # Hours with high ventilation factor
@@ -5,14 +5,15 @@ from __future__ import annotations
 import inspect
 import logging
 import re
+from bisect import bisect_right
 from datetime import UTC, datetime, timedelta
-from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import (
     SensorEntity,
     SensorStateClass,
 )
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
@@ -58,6 +59,29 @@ SCORE_GOOD = 0.5
 SCORE_MODERATE = 0.0
 SCORE_POOR = -0.3
 
+# Icons for scores below, between and above the sorted thresholds
+_SCORE_ICON_THRESHOLDS = (SCORE_MODERATE, SCORE_GOOD)
+_SCORE_ICONS = (
+    ICON_VENTILATION_POOR,
+    ICON_VENTILATION_MODERATE,
+    ICON_VENTILATION_GOOD,
+)
+
+# Advice for scores below, between and above the sorted thresholds
+_SCORE_ADVICE_THRESHOLDS = (SCORE_POOR, SCORE_MODERATE, SCORE_GOOD)
+_SCORE_ADVICE = (
+    "Very poor ventilation - ventilate immediately for 20+ minutes",
+    "Poor ventilation - open windows for 10-15 minutes",
+    "Moderate ventilation - consider opening windows briefly",
+    "Good ventilation - no action needed",
+)
+
+# Sensor states that carry no reading
+_UNAVAILABLE_STATES = frozenset((STATE_UNKNOWN, STATE_UNAVAILABLE))
+
+# Characters replaced by "_" when deriving the entity object id from a room name
+_OBJECT_ID_INVALID_CHARS = re.compile(r"[^a-zA-Z0-9_]")
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -69,12 +93,11 @@ async def async_setup_entry(
     # Initial refresh for coordinator data
     await coordinator.async_refresh()
 
-    entities: list[VentilationSensor] = []
-    rooms_data = entry.data.get(CONF_ROOMS, {})
-
-    for room_name, room_config in rooms_data.items():
-        if room_config.get(CONF_ENABLED, True):
-            entities.append(VentilationSensor(coordinator, room_name, room_config))
+    entities = [
+        VentilationSensor(coordinator, room_name, room_config)
+        for room_name, room_config in entry.data.get(CONF_ROOMS, {}).items()
+        if room_config.get(CONF_ENABLED, True)
+    ]
 
     # Home Assistant allows async_add_entities to be either sync or return an awaitable.
     # Call it and only await if it returns an awaitable.
@@ -86,6 +109,12 @@ async def async_setup_entry(
 class VentilationDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Data update coordinator for ventilation sensors."""
 
+    # Entity ids resolved from the entry: outdoor temp/humidity/wind sensors,
+    # and (name, temp, humidity, co2, room type) for each enabled room
+    _outdoor_plan: tuple[str | None, str | None, str | None]
+    _room_plan: list[tuple[str, str | None, str | None, str | None, str | None]]
+    _entity_ids: tuple[str, ...]
+
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize the coordinator."""
         scan_interval = entry.options.get(CONF_SCAN_INTERVAL) or entry.data.get(
@@ -99,92 +128,193 @@ class VentilationDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             update_interval=timedelta(seconds=scan_interval),
         )
         self.entry = entry
-        self.calculator = VentilationCalculator({})
+        self.calculator = VentilationCalculator.get({})
+        # Device info shared by all sensors of this entry
+        self.device_info: dict[str, Any] = {
+            "identifiers": {(DOMAIN, entry.entry_id)},
+            "name": "Room Ventilation Advisor",
+            "manufacturer": "GitHub Community",
+            "model": "Ventilation Calculator",
+            "sw_version": "1.0.0",
+        }
+        self._rebuild_room_plan()
+        entry.async_on_unload(entry.add_update_listener(self._async_entry_updated))
 
-    async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch data from sensors."""
-        data = {}
+    async def _async_entry_updated(
+        self,
+        _hass: HomeAssistant,
+        _entry: ConfigEntry,
+    ) -> None:
+        """Re-resolve sensor ids when the entry data or options change."""
+        self._rebuild_room_plan()
+
+    def _rebuild_room_plan(self) -> None:
+        """Resolve the sensor entity ids to read on every update."""
+        options = self.entry.options
+        data = self.entry.data
 
         # Get outdoor sensors - check options first, then config
-        outdoor_temp_entity = self.entry.options.get(
-            CONF_OUTDOOR_TEMP_SENSOR,
-        ) or self.entry.data.get(CONF_OUTDOOR_TEMP_SENSOR)
-        outdoor_humidity_entity = self.entry.options.get(
-            CONF_OUTDOOR_HUMIDITY_SENSOR,
-        ) or self.entry.data.get(CONF_OUTDOOR_HUMIDITY_SENSOR)
-        wind_entity = self.entry.options.get(CONF_WIND_SENSOR) or self.entry.data.get(
-            CONF_WIND_SENSOR,
+        self._outdoor_plan = (
+            options.get(CONF_OUTDOOR_TEMP_SENSOR) or data.get(CONF_OUTDOOR_TEMP_SENSOR),
+            options.get(CONF_OUTDOOR_HUMIDITY_SENSOR)
+            or data.get(CONF_OUTDOOR_HUMIDITY_SENSOR),
+            options.get(CONF_WIND_SENSOR) or data.get(CONF_WIND_SENSOR),
         )
 
-        try:
-            outdoor_temp = self._get_sensor_value(outdoor_temp_entity)
-            outdoor_humidity = self._get_sensor_value(outdoor_humidity_entity)
-            wind_speed = self._get_sensor_value(wind_entity)
-
-            data["outdoor_temp"] = outdoor_temp
-            data["outdoor_humidity"] = outdoor_humidity
-            data["wind_speed"] = wind_speed
-
-        except (ValueError, TypeError):
-            _LOGGER.exception("Error reading outdoor sensors")
-            raise
-
-        # Get room data
-        rooms_data = self.entry.data.get(CONF_ROOMS, {})
-        room_options = self.entry.options.get("room_settings", {})
-        room_data = {}
-
-        for room_name, room_config in rooms_data.items():
+        room_options = options.get("room_settings", {})
+        room_plan = []
+        for room_name, room_config in data.get(CONF_ROOMS, {}).items():
             # Check if room is enabled (from options or config)
             room_settings = room_options.get(room_name, {})
             default_enabled = room_config.get(CONF_ENABLED, True)
-            room_enabled = room_settings.get("enabled", default_enabled)
-            if not room_enabled:
+            if not room_settings.get("enabled", default_enabled):
                 continue
 
-            try:
-                # Get room sensors - check options first, then config
-                temp_sensor = room_settings.get(CONF_TEMP_SENSOR) or room_config.get(
-                    CONF_TEMP_SENSOR,
-                )
-                humidity_sensor = room_settings.get(
-                    CONF_HUMIDITY_SENSOR,
-                ) or room_config.get(CONF_HUMIDITY_SENSOR)
-                co2_sensor = room_settings.get(CONF_CO2_SENSOR) or room_config.get(
-                    CONF_CO2_SENSOR,
-                )
-                room_type = room_settings.get(CONF_ROOM_TYPE) or room_config.get(
-                    CONF_ROOM_TYPE,
+            # Get room sensors - check options first, then config
+            room_plan.append(
+                (
+                    room_name,
+                    room_settings.get(CONF_TEMP_SENSOR)
+                    or room_config.get(CONF_TEMP_SENSOR),
+                    room_settings.get(CONF_HUMIDITY_SENSOR)
+                    or room_config.get(CONF_HUMIDITY_SENSOR),
+                    room_settings.get(CONF_CO2_SENSOR)
+                    or room_config.get(CONF_CO2_SENSOR),
+                    room_settings.get(CONF_ROOM_TYPE)
+                    or room_config.get(CONF_ROOM_TYPE),
+                ),
+            )
+        self._room_plan = room_plan
+
+        # Each distinct entity id once, rooms often share sensors
+        self._entity_ids = tuple(
+            dict.fromkeys(
+                entity_id
+                for entity_id in (
+                    *self._outdoor_plan,
+                    *(sensor for _, *sensors, _ in room_plan for sensor in sensors),
                 )
+                if entity_id
+            ),
+        )
 
-                indoor_temp = self._get_sensor_value(temp_sensor)
-                indoor_humidity = self._get_sensor_value(humidity_sensor)
-                co2_level = None
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch data from sensors."""
+        # Without enabled rooms there are no sensors to feed, skip all reads
+        if not self._room_plan:
+            now = datetime.now(UTC)
+            return {
+                "outdoor_temp": None,
+                "outdoor_humidity": None,
+                "wind_speed": None,
+                "rooms": {},
+                "hour": now.hour,
+                "month": now.month,
+                "scores": {},
+            }
 
-                if co2_sensor:
-                    co2_level = self._get_sensor_value(co2_sensor)
+        data = {}
+        outdoor_temp_entity, outdoor_humidity_entity, wind_entity = self._outdoor_plan
 
-                room_data[room_name] = {
-                    "indoor_temp": indoor_temp,
-                    "indoor_humidity": indoor_humidity,
-                    "co2_level": co2_level,
-                    "room_type": room_type,
-                }
+        try:
+            values = {
+                entity_id: self._get_sensor_value(entity_id)
+                for entity_id in self._entity_ids
+            }
+        except (ValueError, TypeError):
+            _LOGGER.exception("Error reading sensors")
+            raise
 
-            except (ValueError, TypeError):
-                _LOGGER.exception("Error reading sensors for room %s", room_name)
-                continue
+        data["outdoor_temp"] = values.get(outdoor_temp_entity)
+        data["outdoor_humidity"] = values.get(outdoor_humidity_entity)
+        data["wind_speed"] = values.get(wind_entity)
+
+        # Get room data
+        room_data = {
+            room_name: {
+                "indoor_temp": values.get(temp_sensor),
+                "indoor_humidity": values.get(humidity_sensor),
+                "co2_level": values.get(co2_sensor),
+                "room_type": room_type,
+            }
+            for (
+                room_name,
+                temp_sensor,
+                humidity_sensor,
+                co2_sensor,
+                room_type,
+            ) in self._room_plan
+        }
 
         data["rooms"] = room_data
+
+        # One clock read per tick, shared by all rooms
+        now = datetime.now(UTC)
+        data["hour"] = now.hour
+        data["month"] = now.month
+        data["scores"] = self._calculate_scores(data, room_data)
         return data
 
+    def _calculate_scores(
+        self,
+        data: dict[str, Any],
+        room_data: dict[str, dict[str, Any]],
+    ) -> dict[str, float]:
+        """Score every room with complete readings in one batch."""
+        temp_out = data["outdoor_temp"]
+        humidity_out = data["outdoor_humidity"]
+        wind_speed = data["wind_speed"]
+        if temp_out is None or humidity_out is None or wind_speed is None:
+            return {}
+
+        hour = data["hour"]
+        month = data["month"]
+        room_names = []
+        rooms = []
+        for room_name, room in room_data.items():
+            if room["indoor_temp"] is None or room["indoor_humidity"] is None:
+                continue
+            room_names.append(room_name)
+            rooms.append(
+                RoomData(
+                    temp_in=room["indoor_temp"],
+                    humidity_in=room["indoor_humidity"],
+                    temp_out=temp_out,
+                    humidity_out=humidity_out,
+                    wind_speed=wind_speed,
+                    hour=hour,
+                    month=month,
+                    room_type=room["room_type"],
+                    co2=room["co2_level"],
+                ),
+            )
+
+        try:
+            scores = self.calculator.calculate_room_scores_batch(rooms)
+        except (ValueError, TypeError):
+            _LOGGER.debug("Batch scoring failed, scoring rooms one by one")
+        else:
+            return dict(zip(room_names, scores, strict=True))
+
+        # Isolate the failing rooms so the others keep their scores
+        room_scores = {}
+        for room_name, room in zip(room_names, rooms, strict=True):
+            try:
+                room_scores[room_name] = self.calculator.calculate_room_score(room)
+            except (ValueError, TypeError):
+                _LOGGER.exception(
+                    "Error calculating ventilation score for %s",
+                    room_name,
+                )
+        return room_scores
+
     def _get_sensor_value(self, entity_id: str | None) -> float | None:
         """Get sensor value from entity."""
         if not entity_id:
             return None
 
         state = self.hass.states.get(entity_id)
-        if state and state.state not in ["unknown", "unavailable"]:
+        if state and state.state not in _UNAVAILABLE_STATES:
             try:
                 return float(state.state)
             except ValueError:
@@ -213,98 +343,58 @@ class VentilationSensor(
         self.room_config = room_config
         self._attr_unique_id = f"{coordinator.entry.entry_id}_{room_name}"
         self._attr_name = f"{room_name} Ventilation Score"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, self.coordinator.entry.entry_id)},
-            "name": "Room Ventilation Advisor",
-            "manufacturer": "GitHub Community",
-            "model": "Ventilation Calculator",
-            "sw_version": "1.0.0",
-        }
-        object_id = re.sub(r"[^a-zA-Z0-9_]", "_", self.room_name.lower())
+        self._attr_device_info = coordinator.device_info
+        object_id = _OBJECT_ID_INVALID_CHARS.sub("_", self.room_name.lower())
         self._attr_entity_id = f"sensor.{object_id}_ventilation_score"
         self._attr_icon = ICON_VENTILATION
         self._attr_extra_state_attributes = {}
+        # Score is computed once per coordinator update and read from here
+        self._cached_score = self._compute_score()
 
-    @cached_property
+    @property
     def native_value(self) -> float | None:
-        """Return the ventilation score."""
-        if not self.coordinator.data:
-            return None
-
-        room_data = self.coordinator.data.get("rooms", {}).get(self.room_name)
-        if not room_data:
-            return None
-
-        # Check if all required values are available
-        temp_out = self.coordinator.data.get("outdoor_temp")
-        humidity_out = self.coordinator.data.get("outdoor_humidity")
-        wind_speed = self.coordinator.data.get("wind_speed")
-
-        if temp_out is None or humidity_out is None or wind_speed is None:
-            return None
+        """Return the ventilation score of the last coordinator update."""
+        return self._cached_score
 
-        try:
-            room_data_obj = RoomData(
-                temp_in=room_data["indoor_temp"],
-                humidity_in=room_data["indoor_humidity"],
-                temp_out=temp_out,
-                humidity_out=humidity_out,
-                wind_speed=wind_speed,
-                hour=datetime.now(UTC).hour,
-                month=datetime.now(UTC).month,
-                room_type=room_data["room_type"],
-                co2=room_data.get("co2_level"),
-            )
-            score = self.coordinator.calculator.calculate_room_score(room_data_obj)
-            return round(score, 2)
-        except (ValueError, TypeError):
-            _LOGGER.exception(
-                "Error calculating ventilation score for %s",
-                self.room_name,
-            )
+    def _compute_score(self) -> float | None:
+        """Return this room's score from the coordinator's batch-computed scores."""
+        data = self.coordinator.data
+        if not data:
             return None
+        return data.get("scores", {}).get(self.room_name)
 
     def _get_ventilation_advice(self) -> str:
         """Get ventilation advice based on score."""
-        if self.native_value is None:
-            return "Unable to calculate ventilation advice"
-
         score = self.native_value
-        if score >= SCORE_GOOD:
-            return "Good ventilation - no action needed"
-        if score >= SCORE_MODERATE:
-            return "Moderate ventilation - consider opening windows briefly"
-        if score >= SCORE_POOR:
-            return "Poor ventilation - open windows for 10-15 minutes"
-        return "Very poor ventilation - ventilate immediately for 20+ minutes"
+        if score is None:
+            return "Unable to calculate ventilation advice"
+        return _SCORE_ADVICE[bisect_right(_SCORE_ADVICE_THRESHOLDS, score)]
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        self._cached_score = self._compute_score()
         self._update_icon()
         self._update_extra_state_attributes()
         self.async_write_ha_state()
 
     def _update_icon(self) -> None:
         """Update the icon based on current ventilation score."""
-        if self.native_value is None:
-            self._attr_icon = ICON_VENTILATION
-        else:
-            score = self.native_value
-            if score >= SCORE_GOOD:
-                self._attr_icon = ICON_VENTILATION_GOOD
-            elif score >= SCORE_MODERATE:
-                self._attr_icon = ICON_VENTILATION_MODERATE
-            else:
-                self._attr_icon = ICON_VENTILATION_POOR
+        score = self.native_value
+        self._attr_icon = (
+            ICON_VENTILATION
+            if score is None
+            else _SCORE_ICONS[bisect_right(_SCORE_ICON_THRESHOLDS, score)]
+        )
 
     def _update_extra_state_attributes(self) -> None:
         """Update extra state attributes."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             self._attr_extra_state_attributes = {}
             return
 
-        room_data = self.coordinator.data.get("rooms", {}).get(self.room_name)
+        room_data = data.get("rooms", {}).get(self.room_name)
         if not room_data:
             self._attr_extra_state_attributes = {}
             return
@@ -316,20 +406,18 @@ class VentilationSensor(
         }
 
         # Add sensor values if available
-        if room_data.get("indoor_temp") is not None:
-            attributes[ATTR_TEMPERATURE_INDOOR] = room_data["indoor_temp"]
-        if room_data.get("indoor_humidity") is not None:
-            attributes[ATTR_HUMIDITY_INDOOR] = room_data["indoor_humidity"]
-        if room_data.get("co2_level") is not None:
-            attributes[ATTR_CO2_LEVEL] = room_data["co2_level"]
-
-        if self.coordinator.data.get("outdoor_temp") is not None:
-            attributes[ATTR_TEMPERATURE_OUTDOOR] = self.coordinator.data["outdoor_temp"]
-        if self.coordinator.data.get("outdoor_humidity") is not None:
-            attributes[ATTR_HUMIDITY_OUTDOOR] = self.coordinator.data[
-                "outdoor_humidity"
-            ]
-        if self.coordinator.data.get("wind_speed") is not None:
-            attributes[ATTR_WIND_SPEED] = self.coordinator.data["wind_speed"]
+        if (temp_in := room_data.get("indoor_temp")) is not None:
+            attributes[ATTR_TEMPERATURE_INDOOR] = temp_in
+        if (humidity_in := room_data.get("indoor_humidity")) is not None:
+            attributes[ATTR_HUMIDITY_INDOOR] = humidity_in
+        if (co2_level := room_data.get("co2_level")) is not None:
+            attributes[ATTR_CO2_LEVEL] = co2_level
+
+        if (temp_out := data.get("outdoor_temp")) is not None:
+            attributes[ATTR_TEMPERATURE_OUTDOOR] = temp_out
+        if (humidity_out := data.get("outdoor_humidity")) is not None:
+            attributes[ATTR_HUMIDITY_OUTDOOR] = humidity_out
+        if (wind_speed := data.get("wind_speed")) is not None:
+            attributes[ATTR_WIND_SPEED] = wind_speed
 
         self._attr_extra_state_attributes = attributes
@@ -2,8 +2,9 @@
 
 import logging
 import tempfile
-from collections.abc import AsyncGenerator, Generator
+from collections.abc import AsyncGenerator, Callable, Generator, Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import pytest
@@ -11,6 +12,9 @@ from homeassistant.core import HomeAssistant
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.room_ventilation_advisor import DOMAIN
+from custom_components.room_ventilation_advisor.config_flow import (
+    RoomVentilationAdvisorOptionsFlow,
+)
 from custom_components.room_ventilation_advisor.const import (
     CONF_CO2_SENSOR,
     CONF_ENABLED,
@@ -66,6 +70,37 @@ async def mock_hass() -> AsyncGenerator[HomeAssistant, Any]:
         yield hass
 
 
+@pytest.fixture(scope="session")
+def base_entry_data() -> Mapping[str, Any]:
+    """Return read-only config entry data shared by the options flow tests."""
+    return MappingProxyType(
+        {
+            CONF_NAME: "Test Advisor",
+            CONF_OUTDOOR_TEMP_SENSOR: "sensor.outdoor_temp",
+            CONF_OUTDOOR_HUMIDITY_SENSOR: "sensor.outdoor_humidity",
+            CONF_WIND_SENSOR: "sensor.wind_speed",
+            CONF_SCAN_INTERVAL: 300,
+            CONF_ROOMS: {},
+        },
+    )
+
+
+@pytest.fixture
+def make_options_flow(
+    hass: HomeAssistant,
+) -> Callable[[MockConfigEntry], RoomVentilationAdvisorOptionsFlow]:
+    """Return a factory for options flows bound to the test hass instance."""
+
+    def _make_options_flow(
+        config_entry: MockConfigEntry,
+    ) -> RoomVentilationAdvisorOptionsFlow:
+        flow = RoomVentilationAdvisorOptionsFlow(config_entry)
+        flow.hass = hass
+        return flow
+
+    return _make_options_flow
+
+
 @pytest.fixture(name="config_entry")
 def config_entry_fixture() -> MockConfigEntry:
     """Create a mock config entry for testing."""
@@ -83,11 +118,11 @@ def config_entry_fixture() -> MockConfigEntry:
     )
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(autouse=True, scope="session")
 def suppress_expected_test_errors() -> Generator[None]:
-    """Automatically suppress expected test environment errors for all tests."""
+    """Suppress expected test environment errors once for the whole session."""
     # Store original handlers
-    original_handlers = {}
+    original_handlers: dict[str, tuple[logging.Handler, ...]] = {}
     null_handler = logging.NullHandler()
 
     loggers_to_suppress = [
@@ -99,15 +134,12 @@ def suppress_expected_test_errors() -> Generator[None]:
 
     for logger_name in loggers_to_suppress:
         logger = logging.getLogger(logger_name)
-        original_handlers[logger_name] = logger.handlers[:]
-        logger.handlers.clear()
-        logger.addHandler(null_handler)
+        original_handlers[logger_name] = tuple(logger.handlers)
+        logger.handlers[:] = [null_handler]
         logger.setLevel(logging.CRITICAL)
 
-    yield  # Test runs here
+    yield  # Tests run here
 
     # Restore original handlers
     for logger_name, handlers in original_handlers.items():
-        logger = logging.getLogger(logger_name)
-        logger.handlers.clear()
-        logger.handlers.extend(handlers)
+        logging.getLogger(logger_name).handlers[:] = handlers
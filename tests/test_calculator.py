@@ -1,15 +1,30 @@
 """Tests for ventilation calculator logic."""
 
-import math
+from bisect import bisect_left, bisect_right
+from dataclasses import replace
+from itertools import product
+from math import exp
+from typing import Any
 
+import numpy as np
 import pytest
 
+from custom_components.room_ventilation_advisor.calculator import (
+    RoomData,
+    VentilationCalculator,
+)
 from custom_components.room_ventilation_advisor.const import (
+    CONF_ADVANCED_SETTINGS,
+    CONF_CO2_THRESHOLDS,
+    CONF_SCORE_WEIGHTS,
+    DEFAULT_CO2_THRESHOLDS,
+    DEFAULT_SCORE_WEIGHTS,
     ROOM_TYPE_BATHROOM,
     ROOM_TYPE_BEDROOM,
     ROOM_TYPE_KITCHEN,
     ROOM_TYPE_LIVING_ROOM,
     ROOM_TYPE_OFFICE,
+    ROOM_TYPES,
 )
 
 # Test constants for magic values
@@ -26,266 +41,319 @@ CO2_LOW_FACTOR = 0.3
 TIME_FACTOR_HIGH = 0.8
 TIME_FACTOR_LOW = 0.2
 TIME_FACTOR_MEDIUM = 0.5
-TIME_FACTOR_MEDIUM = 0.9
-
-
-class TestVentilationCalculator:
-    """Test the ventilation calculation logic."""
-
-    def test_calculate_absolute_humidity(self) -> None:
-        """Test absolute humidity calculation."""
-
-        # This would be part of the calculator class
-        def calculate_absolute_humidity(
-            humidity_percent: float,
-            temp_celsius: float,
-        ) -> float:
-            """Calculate absolute humidity in g/m³."""
-            saturation_vapor_pressure = 6.112 * math.exp(
-                (17.67 * temp_celsius) / (temp_celsius + 243.5),
-            )
-            return (
-                (humidity_percent / 100)
-                * saturation_vapor_pressure
-                * 2.1674
-                / (273.15 + temp_celsius)
-                * 1000
+KITCHEN_PEAK_FACTOR = 0.9
+
+
+# Months and hours the reference helpers treat specially
+_WINTER_MONTHS = frozenset({12, 1, 2})
+_SUMMER_MONTHS = frozenset({6, 7, 8})
+_PEAK_HOURS = frozenset({7, 8, 9, 18, 19, 20})
+_MID_HOURS = frozenset({6, 10, 11, 16, 17, 21})
+_BEDROOM_HOURS = frozenset({6, 7, 8, 9, 21, 22, 23})
+_BATHROOM_HOURS = frozenset({6, 7, 8, 9, 18, 19, 20, 21, 22})
+_OFFICE_HOURS = frozenset(range(8, 18))
+_KITCHEN_MORNING_HOURS = frozenset({6, 7, 8})
+_KITCHEN_PEAK_HOURS = frozenset({11, 12, 13, 17, 18, 19, 20})
+_LIVING_MORNING_HOURS = frozenset({6, 7, 8, 9})
+_LIVING_EVENING_HOURS = frozenset({17, 18, 19, 20, 21, 22})
+_LIVING_DAY_HOURS = frozenset(range(10, 17))
+
+
+def calculate_absolute_humidity(humidity_percent: float, temp_celsius: float) -> float:
+    """Calculate absolute humidity in g/m³."""
+    saturation_vapor_pressure = 6.112 * exp(
+        (17.67 * temp_celsius) / (temp_celsius + 243.5),
+    )
+    return (
+        (humidity_percent / 100)
+        * saturation_vapor_pressure
+        * 2.1674
+        / (273.15 + temp_celsius)
+        * 1000
+    )
+
+
+def calculate_absolute_humidity_vec(
+    humidity_percent: np.ndarray,
+    temp_celsius: np.ndarray,
+) -> np.ndarray:
+    """Calculate absolute humidity in g/m³ for arrays of readings."""
+    saturation_vapor_pressure = 6.112 * np.exp(
+        (17.67 * temp_celsius) / (temp_celsius + 243.5),
+    )
+    return (
+        (humidity_percent / 100)
+        * saturation_vapor_pressure
+        * 2.1674
+        / (273.15 + temp_celsius)
+        * 1000
+    )
+
+
+# Temperature difference thresholds and the factor at or below, between and
+# above them, per month
+_WINTER_TEMP_BANDS = ((0, 2), (0, 0.4, 0.8))
+_SUMMER_TEMP_BANDS = ((0, 3), (0, 0.3, 0.8))
+_OTHER_TEMP_BANDS = ((-2, 1), (0, 0.3, 0.6))
+_TEMP_BANDS = {
+    month: _WINTER_TEMP_BANDS
+    if month in _WINTER_MONTHS
+    else (_SUMMER_TEMP_BANDS if month in _SUMMER_MONTHS else _OTHER_TEMP_BANDS)
+    for month in range(1, 13)
+}
+
+
+def calculate_temp_factor(temp_diff: float, month: int) -> float:
+    """Calculate the seasonal temperature factor."""
+    thresholds, factors = _TEMP_BANDS.get(month, _OTHER_TEMP_BANDS)
+    return factors[bisect_left(thresholds, temp_diff)]
+
+
+def calculate_humidity_factor(ah_in: float, ah_out: float) -> float:
+    """Calculate the absolute humidity factor."""
+    return 1 if (ah_in - ah_out) > 1 else (0.5 if ah_in > ah_out else 0)
+
+
+def _build_co2_hour_table() -> dict[str, tuple[float, ...]]:
+    """Build the occupancy pattern CO2 factor per room type and hour."""
+    hours = range(24)
+    return {
+        ROOM_TYPE_BEDROOM: tuple(
+            0.8 if hour in _BEDROOM_HOURS else 0.2 for hour in hours
+        ),
+        ROOM_TYPE_BATHROOM: tuple(
+            0.7 if hour in _BATHROOM_HOURS else 0.3 for hour in hours
+        ),
+        ROOM_TYPE_OFFICE: tuple(
+            0.8 if hour in _OFFICE_HOURS else 0.2 for hour in hours
+        ),
+        ROOM_TYPE_KITCHEN: tuple(
+            0.8
+            if hour in _KITCHEN_MORNING_HOURS
+            else (0.9 if hour in _KITCHEN_PEAK_HOURS else 0.3)
+            for hour in hours
+        ),
+        ROOM_TYPE_LIVING_ROOM: tuple(
+            0.7
+            if hour in _LIVING_MORNING_HOURS
+            else (
+                0.6
+                if hour in _LIVING_EVENING_HOURS
+                else (0.3 if hour in _LIVING_DAY_HOURS else 0.2)
             )
+            for hour in hours
+        ),
+    }
+
+
+# Pattern CO2 factor per room type, indexed by hour
+_CO2_HOUR_TABLE = _build_co2_hour_table()
+_DEFAULT_CO2_HOURS = (0.2,) * 24
+
+# CO2 reading thresholds and the factor at or below, between and above them
+_CO2_THRESHOLDS = (800, 1000, 1200)
+_CO2_FACTORS = (0, 0.3, 0.7, 1)
+
+
+def calculate_co2_factor(
+    room_type: str,
+    hour: int,
+    co2: float | None = None,
+) -> float:
+    """Calculate the CO2 factor from a reading or the room occupancy pattern."""
+    if co2 is not None:
+        return _CO2_FACTORS[bisect_left(_CO2_THRESHOLDS, co2)]
+    return _CO2_HOUR_TABLE.get(room_type, _DEFAULT_CO2_HOURS)[hour]
+
+
+# Time of day factor indexed by hour
+_TIME_FACTOR = (
+    (0.2,) * 6
+    + (0.5, 0.8, 0.8, 0.8, 0.5, 0.5)
+    + (0.2,) * 4
+    + (0.5, 0.5, 0.8, 0.8, 0.8, 0.5)
+    + (0.2,) * 2
+)
 
-        # Test cases - corrected expected values
-        result1 = calculate_absolute_humidity(50, 20)
-        assert result1 == pytest.approx(86.4, rel=0.01), (
-            f"Expected ~86.4, got {result1}"
-        )
+# Wind speed thresholds and the factor below, between and above them
+_WIND_THRESHOLDS = (15, 25)
+_WIND_FACTORS = (0, -0.2, -0.5)
 
-        result2 = calculate_absolute_humidity(60, 15)
-        assert result2 == pytest.approx(76.9, rel=0.01), (
-            f"Expected ~76.9, got {result2}"
-        )
 
-        result3 = calculate_absolute_humidity(100, 25)
-        assert result3 == pytest.approx(230.3, rel=0.01), (
-            f"Expected ~230.3, got {result3}"
-        )
+def calculate_time_factor(hour: int) -> float:
+    """Calculate the time of day factor."""
+    return _TIME_FACTOR[hour]
 
-    def test_temperature_factor_winter(self) -> None:
-        """Test temperature factor calculation for winter."""
 
-        def calculate_temp_factor(temp_diff: float, month: int) -> float:
-            winter_months = [12, 1, 2]
-            summer_months = [6, 7, 8]
+def calculate_wind_factor(wind_speed: float, enable_wind: bool = True) -> float:
+    """Calculate the wind factor."""
+    if not enable_wind:
+        return 0
+    return _WIND_FACTORS[bisect_right(_WIND_THRESHOLDS, wind_speed)]
 
-            if month in winter_months:
-                return 0.8 if temp_diff > 2 else (0.4 if temp_diff > 0 else 0)
-            if month in summer_months:
-                return 0.8 if temp_diff > 3 else (0.3 if temp_diff > 0 else 0)
-            return 0.6 if temp_diff > 1 else (0.3 if temp_diff > -2 else 0)
 
-        # Winter tests
-        assert calculate_temp_factor(5, 1) == LARGE_TEMP_FACTOR  # Large positive diff
-        assert calculate_temp_factor(1, 1) == SMALL_TEMP_FACTOR  # Small positive diff
-        assert calculate_temp_factor(-1, 1) == ZERO_FACTOR  # Negative diff
+# Temperature, humidity, CO2 and time weights without and with a CO2 reading
+_SCORE_WEIGHTS = {
+    False: (0.35, 0.35, 0.2, 0.1),
+    True: (0.25, 0.25, 0.35, 0.15),
+}
 
-    def test_temperature_factor_summer(self) -> None:
-        """Test temperature factor calculation for summer."""
 
-        def calculate_temp_factor(temp_diff: float, month: int) -> float:
-            winter_months = [12, 1, 2]
-            summer_months = [6, 7, 8]
+def calculate_score(
+    temp_in: float,
+    humidity_in: float,
+    temp_out: float,
+    humidity_out: float,
+    wind: float,
+    hour: int,
+    month: int,
+    room_type: str,
+    co2: float | None = None,
+    enable_wind: bool = True,
+) -> float:
+    """Calculate the complete ventilation score from the factor helpers."""
+    # The score compares absolute humidity without the x1000 display scaling
+    ah_in = calculate_absolute_humidity(humidity_in, temp_in) / 1000
+    ah_out = calculate_absolute_humidity(humidity_out, temp_out) / 1000
 
-            if month in winter_months:
-                return 0.8 if temp_diff > 2 else (0.4 if temp_diff > 0 else 0)
-            if month in summer_months:
-                return 0.8 if temp_diff > 3 else (0.3 if temp_diff > 0 else 0)
-            return 0.6 if temp_diff > 1 else (0.3 if temp_diff > -2 else 0)
+    f_t = calculate_temp_factor(temp_in - temp_out, month)
+    f_rh = calculate_humidity_factor(ah_in, ah_out)
+    f_co2 = calculate_co2_factor(room_type, hour, co2)
+    f_time = calculate_time_factor(hour)
+    f_w = calculate_wind_factor(wind, enable_wind)
 
-        # Summer tests
-        assert calculate_temp_factor(5, 7) == LARGE_TEMP_FACTOR  # Large positive diff
-        assert calculate_temp_factor(2, 7) == MINOR_TEMP_FACTOR  # Small positive diff
-        assert calculate_temp_factor(-1, 7) == ZERO_FACTOR  # Negative diff
+    # Final calculation
+    w_t, w_rh, w_co2, w_time = _SCORE_WEIGHTS[co2 is not None]
+    score = w_t * f_t + w_rh * f_rh + w_co2 * f_co2 + w_time * f_time + f_w
 
-    def test_humidity_factor(self) -> None:
-        """Test humidity factor calculation."""
+    return round(score, 2)
 
-        def calculate_humidity_factor(ah_in: float, ah_out: float) -> float:
-            return 1 if (ah_in - ah_out) > 1 else (0.5 if ah_in > ah_out else 0)
 
-        assert calculate_humidity_factor(10, 8) == HUMIDITY_LARGE_DIFF
-        assert calculate_humidity_factor(9, 8) == HUMIDITY_SMALL_DIFF
-        assert calculate_humidity_factor(7, 8) == ZERO_FACTOR
+class TestVentilationCalculator:
+    """Test the ventilation calculation logic."""
 
-    def test_co2_factor(self) -> None:
+    def test_calculate_absolute_humidity(self) -> None:
+        """Test absolute humidity calculation."""
+        # Test cases - corrected expected values
+        humidity = np.array([50, 60, 100])
+        temperature = np.array([20, 15, 25])
+        expected = [86.4, 76.9, 230.3]
+
+        result = calculate_absolute_humidity_vec(humidity, temperature)
+        np.testing.assert_allclose(result, expected, rtol=0.01)
+
+        # The scalar helper used by calculate_score agrees with the array one
+        scalar = [
+            calculate_absolute_humidity(h, t)
+            for h, t in zip(humidity.tolist(), temperature.tolist(), strict=True)
+        ]
+        np.testing.assert_allclose(scalar, result)
+
+    @pytest.mark.parametrize(
+        ("temp_diff", "month", "expected"),
+        [
+            # Winter
+            (5, 1, LARGE_TEMP_FACTOR),  # Large positive diff
+            (1, 1, SMALL_TEMP_FACTOR),  # Small positive diff
+            (-1, 1, ZERO_FACTOR),  # Negative diff
+            # Summer
+            (5, 7, LARGE_TEMP_FACTOR),  # Large positive diff
+            (2, 7, MINOR_TEMP_FACTOR),  # Small positive diff
+            (-1, 7, ZERO_FACTOR),  # Negative diff
+        ],
+    )
+    def test_temperature_factor(
+        self,
+        temp_diff: float,
+        month: int,
+        expected: float,
+    ) -> None:
+        """Test temperature factor calculation for winter and summer."""
+        assert calculate_temp_factor(temp_diff, month) == expected
+
+    @pytest.mark.parametrize(
+        ("ah_in", "ah_out", "expected"),
+        [
+            (10, 8, HUMIDITY_LARGE_DIFF),
+            (9, 8, HUMIDITY_SMALL_DIFF),
+            (7, 8, ZERO_FACTOR),
+        ],
+    )
+    def test_humidity_factor(
+        self,
+        ah_in: float,
+        ah_out: float,
+        expected: float,
+    ) -> None:
+        """Test humidity factor calculation."""
+        assert calculate_humidity_factor(ah_in, ah_out) == expected
+
+    @pytest.mark.parametrize(
+        ("room_type", "hour", "co2", "expected"),
+        [
+            # CO2 sensor available
+            (ROOM_TYPE_LIVING_ROOM, 12, 1300, CO2_HIGH_FACTOR),
+            (ROOM_TYPE_LIVING_ROOM, 12, 1100, CO2_MEDIUM_FACTOR),
+            (ROOM_TYPE_LIVING_ROOM, 12, 900, CO2_LOW_FACTOR),
+            (ROOM_TYPE_LIVING_ROOM, 12, 700, ZERO_FACTOR),
+            # No CO2 sensor - use patterns
+            (ROOM_TYPE_BEDROOM, 7, None, TIME_FACTOR_HIGH),
+            (ROOM_TYPE_BEDROOM, 14, None, 0.2),  # Afternoon
+            (ROOM_TYPE_OFFICE, 10, None, 0.8),  # Work hours
+            (ROOM_TYPE_KITCHEN, 12, None, KITCHEN_PEAK_FACTOR),  # Lunch time
+        ],
+    )
+    def test_co2_factor(
+        self,
+        room_type: str,
+        hour: int,
+        co2: float | None,
+        expected: float,
+    ) -> None:
         """Test CO2 factor calculation."""
-
-        def calculate_co2_factor(
-            room_type: str,
-            hour: int,
-            co2: float | None = None,
-        ) -> float:
-            if co2 is not None:
-                return (
-                    1
-                    if co2 > 1200
-                    else (0.7 if co2 > 1000 else (0.3 if co2 > 800 else 0))
-                )
-
-            patterns = {
-                ROOM_TYPE_BEDROOM: 0.8 if hour in [6, 7, 8, 9, 21, 22, 23] else 0.2,
-                ROOM_TYPE_BATHROOM: 0.7
-                if hour in [6, 7, 8, 9, 18, 19, 20, 21, 22]
-                else 0.3,
-                ROOM_TYPE_OFFICE: 0.8
-                if hour in [8, 9, 10, 11, 12, 13, 14, 15, 16, 17]
-                else 0.2,
-                ROOM_TYPE_KITCHEN: 0.8
-                if hour in [6, 7, 8]
-                else (0.9 if hour in [11, 12, 13, 17, 18, 19, 20] else 0.3),
-                ROOM_TYPE_LIVING_ROOM: 0.7
-                if hour in [6, 7, 8, 9]
-                else (
-                    0.6
-                    if hour in [17, 18, 19, 20, 21, 22]
-                    else (0.3 if hour in [10, 11, 12, 13, 14, 15, 16] else 0.2)
-                ),
-            }
-            return patterns.get(room_type, 0.2)
-
-        # CO2 sensor available
-        assert calculate_co2_factor(ROOM_TYPE_LIVING_ROOM, 12, 1300) == CO2_HIGH_FACTOR
-        assert (
-            calculate_co2_factor(ROOM_TYPE_LIVING_ROOM, 12, 1100) == CO2_MEDIUM_FACTOR
-        )
-        assert calculate_co2_factor(ROOM_TYPE_LIVING_ROOM, 12, 900) == CO2_LOW_FACTOR
-        assert calculate_co2_factor(ROOM_TYPE_LIVING_ROOM, 12, 700) == ZERO_FACTOR
-
-        # No CO2 sensor - use patterns
-        assert calculate_co2_factor(ROOM_TYPE_BEDROOM, 7) == TIME_FACTOR_HIGH
-        assert calculate_co2_factor(ROOM_TYPE_BEDROOM, 14) == 0.2  # Afternoon
-        assert calculate_co2_factor(ROOM_TYPE_OFFICE, 10) == 0.8  # Work hours
-        assert calculate_co2_factor(ROOM_TYPE_KITCHEN, 12) == 0.9  # Lunch time
-
-    def test_time_factor(self) -> None:
+        assert calculate_co2_factor(room_type, hour, co2) == expected
+
+    @pytest.mark.parametrize(
+        ("hour", "expected"),
+        [
+            (8, TIME_FACTOR_HIGH),  # Peak morning
+            (6, TIME_FACTOR_MEDIUM),  # Early morning
+            (14, TIME_FACTOR_LOW),  # Afternoon
+        ],
+    )
+    def test_time_factor(self, hour: int, expected: float) -> None:
         """Test time factor calculation."""
+        assert calculate_time_factor(hour) == expected
 
-        def calculate_time_factor(hour: int) -> float:
-            return (
-                0.8
-                if hour in [7, 8, 9, 18, 19, 20]
-                else (0.5 if hour in [6, 10, 11, 16, 17, 21] else 0.2)
-            )
-
-        assert calculate_time_factor(8) == 0.8  # Peak morning
-        assert calculate_time_factor(6) == 0.5  # Early morning
-        assert calculate_time_factor(14) == 0.2  # Afternoon
-
-    def test_wind_factor(self) -> None:
+    def test_time_factor_table(self) -> None:
+        """Test the time factor table matches the peak and mid hours."""
+        expected = tuple(
+            0.8 if hour in _PEAK_HOURS else (0.5 if hour in _MID_HOURS else 0.2)
+            for hour in range(24)
+        )
+        assert expected == _TIME_FACTOR
+
+    @pytest.mark.parametrize(
+        ("wind_speed", "enable_wind", "expected"),
+        [
+            (10, True, 0),  # Low wind
+            (20, True, -0.2),  # Medium wind
+            (30, True, -0.5),  # High wind
+            (20, False, 0),  # Wind disabled
+        ],
+    )
+    def test_wind_factor(
+        self,
+        wind_speed: float,
+        *,
+        enable_wind: bool,
+        expected: float,
+    ) -> None:
         """Test wind factor calculation."""
-
-        def calculate_wind_factor(wind_speed: float, enable_wind: bool = True) -> float:
-            if not enable_wind:
-                return 0
-            return 0 if wind_speed < 15 else (-0.2 if wind_speed < 25 else -0.5)
-
-        assert calculate_wind_factor(10, True) == 0  # Low wind
-        assert calculate_wind_factor(20, True) == -0.2  # Medium wind
-        assert calculate_wind_factor(30, True) == -0.5  # High wind
-        assert calculate_wind_factor(20, False) == 0  # Wind disabled
+        assert calculate_wind_factor(wind_speed, enable_wind) == expected
 
     def test_overall_score_calculation(self) -> None:
         """Test complete score calculation."""
-
-        def calculate_score(
-            temp_in: float,
-            humidity_in: float,
-            temp_out: float,
-            humidity_out: float,
-            wind: float,
-            hour: int,
-            month: int,
-            room_type: str,
-            co2: float | None = None,
-            enable_wind: bool = True,
-        ) -> float:
-            # Absolute humidity
-            ah_in = (humidity_in / 100) * (
-                6.112
-                * math.exp((17.67 * temp_in) / (temp_in + 243.5))
-                * 2.1674
-                / (273.15 + temp_in)
-            )
-            ah_out = (humidity_out / 100) * (
-                6.112
-                * math.exp((17.67 * temp_out) / (temp_out + 243.5))
-                * 2.1674
-                / (273.15 + temp_out)
-            )
-
-            # Temperature factor
-            temp_diff = temp_in - temp_out
-            winter_months = [12, 1, 2]
-            summer_months = [6, 7, 8]
-
-            if month in winter_months:
-                f_t = 0.8 if temp_diff > 2 else (0.4 if temp_diff > 0 else 0)
-            elif month in summer_months:
-                f_t = 0.8 if temp_diff > 3 else (0.3 if temp_diff > 0 else 0)
-            else:
-                f_t = 0.6 if temp_diff > 1 else (0.3 if temp_diff > -2 else 0)
-
-            # Humidity factor
-            f_rh = 1 if (ah_in - ah_out) > 1 else (0.5 if ah_in > ah_out else 0)
-
-            # CO2 factor
-            if co2 is not None:
-                f_co2 = (
-                    1
-                    if co2 > 1200
-                    else (0.7 if co2 > 1000 else (0.3 if co2 > 800 else 0))
-                )
-            else:
-                patterns = {
-                    ROOM_TYPE_BEDROOM: 0.8 if hour in [6, 7, 8, 9, 21, 22, 23] else 0.2,
-                    ROOM_TYPE_BATHROOM: 0.7
-                    if hour in [6, 7, 8, 9, 18, 19, 20, 21, 22]
-                    else 0.3,
-                    ROOM_TYPE_OFFICE: 0.8
-                    if hour in [8, 9, 10, 11, 12, 13, 14, 15, 16, 17]
-                    else 0.2,
-                    ROOM_TYPE_KITCHEN: 0.8
-                    if hour in [6, 7, 8]
-                    else (0.9 if hour in [11, 12, 13, 17, 18, 19, 20] else 0.3),
-                    ROOM_TYPE_LIVING_ROOM: 0.7
-                    if hour in [6, 7, 8, 9]
-                    else (
-                        0.6
-                        if hour in [17, 18, 19, 20, 21, 22]
-                        else (0.3 if hour in [10, 11, 12, 13, 14, 15, 16] else 0.2)
-                    ),
-                }
-                f_co2 = patterns.get(room_type, 0.2)
-
-            # Time factor
-            f_time = (
-                0.8
-                if hour in [7, 8, 9, 18, 19, 20]
-                else (0.5 if hour in [6, 10, 11, 16, 17, 21] else 0.2)
-            )
-
-            # Wind factor
-            f_w = (
-                0
-                if not enable_wind
-                else (0 if wind < 15 else (-0.2 if wind < 25 else -0.5))
-            )
-
-            # Final calculation
-            if co2 is None:
-                score = 0.35 * f_t + 0.35 * f_rh + 0.2 * f_co2 + 0.1 * f_time + f_w
-            else:
-                score = 0.25 * f_t + 0.25 * f_rh + 0.35 * f_co2 + 0.15 * f_time + f_w
-
-            return round(score, 2)
-
         # Test case 1: Good ventilation conditions
         score = calculate_score(
             temp_in=22,
@@ -315,3 +383,185 @@ class TestVentilationCalculator:
             enable_wind=True,
         )
         assert score < 0.3  # Should be poor for ventilation
+
+    @pytest.mark.parametrize("hour", [-1, 24, 25])
+    @pytest.mark.parametrize("co2", [None, 900])
+    def test_hour_outside_day_is_off_peak(self, hour: int, co2: float | None) -> None:
+        """Test hours outside 0-23 score like an off-peak hour."""
+        calculator = VentilationCalculator({})
+
+        for room_type in [*ROOM_TYPES, "unknown"]:
+            room = RoomData(
+                temp_in=21,
+                humidity_in=50,
+                temp_out=10,
+                humidity_out=70,
+                wind_speed=5,
+                hour=hour,
+                month=4,
+                room_type=room_type,
+                co2=co2,
+            )
+            # Midnight is off-peak for the time factor and every room pattern
+            expected = calculator.calculate_room_score(replace(room, hour=0))
+            assert calculator.calculate_room_score(room) == expected
+
+    @pytest.mark.parametrize("month", [0, 13, -1])
+    def test_month_outside_year_uses_default_band(self, month: int) -> None:
+        """Test months outside 1-12 score with the default temperature band."""
+        calculator = VentilationCalculator({})
+        room = RoomData(
+            temp_in=22,
+            humidity_in=50,
+            temp_out=20.5,
+            humidity_out=70,
+            wind_speed=5,
+            hour=12,
+            month=month,
+            room_type=ROOM_TYPE_OFFICE,
+        )
+
+        expected = calculator.calculate_room_score(replace(room, month=4))
+        assert calculator.calculate_room_score(room) == expected
+
+    def test_configured_months_outside_year_are_ignored(self) -> None:
+        """Test out of range season months neither raise nor alias a month."""
+        calculator = VentilationCalculator({"winter_months": [13, -1, 1]})
+        room = RoomData(
+            temp_in=22,
+            humidity_in=50,
+            temp_out=20.5,
+            humidity_out=70,
+            wind_speed=5,
+            hour=12,
+            month=12,
+            room_type=ROOM_TYPE_OFFICE,
+        )
+
+        # December is no longer a winter month and -1 must not make it one
+        expected = calculator.calculate_room_score(replace(room, month=4))
+        assert calculator.calculate_room_score(room) == expected
+        assert calculator.calculate_room_score(
+            replace(room, month=1),
+        ) != calculator.calculate_room_score(room)
+
+
+class TestVentilationCalculatorBatch:
+    """Test batch scoring against the scalar calculator."""
+
+    @staticmethod
+    def _rooms() -> list[RoomData]:
+        """Build a spread of rooms covering every factor branch."""
+        return [
+            RoomData(
+                temp_in=18.0 + index,
+                humidity_in=40.0 + 3 * hour,
+                temp_out=-5.0 + 2 * hour,
+                humidity_out=90.0 - 2 * hour,
+                wind_speed=float(3 * hour),
+                hour=hour,
+                month=month,
+                room_type=room_type,
+                co2=None if index % 2 else 600.0 + 25 * hour * index,
+            )
+            for (index, room_type), hour, month in product(
+                enumerate([*ROOM_TYPES, "unknown"] * 2),
+                (-1, *range(0, 24, 5), 24),
+                (0, 1, 5, 7, 13),
+            )
+        ]
+
+    @pytest.mark.parametrize("enable_wind", [True, False])
+    def test_batch_matches_scalar(self, *, enable_wind: bool) -> None:
+        """Test batch scores equal the per-room scores."""
+        calculator = VentilationCalculator({"enable_wind_factor": enable_wind})
+        rooms = self._rooms()
+
+        expected = [calculator.calculate_room_score(room) for room in rooms]
+        assert calculator.calculate_room_scores_batch(rooms) == expected
+
+    def test_batch_empty(self) -> None:
+        """Test batch scoring of no rooms."""
+        assert VentilationCalculator({}).calculate_room_scores_batch([]) == []
+
+
+class TestVentilationCalculatorSettings:
+    """Test loading advanced settings into the calculator."""
+
+    def test_advanced_settings_override_defaults(self) -> None:
+        """Test configured keys override defaults and missing keys fall back."""
+        calculator = VentilationCalculator(
+            {CONF_ADVANCED_SETTINGS: {CONF_CO2_THRESHOLDS: {"poor": 900}}},
+        )
+
+        assert calculator.co2_poor == 900
+        assert calculator.co2_very_poor == DEFAULT_CO2_THRESHOLDS["very_poor"]
+        assert calculator.weight_temp == DEFAULT_SCORE_WEIGHTS["temperature"]
+
+
+class TestVentilationCalculatorCache:
+    """Test the shared calculator factory."""
+
+    def test_get_reuses_calculator_for_equal_config(self) -> None:
+        """Test equal configurations share one calculator instance."""
+        config = {"enable_wind_factor": False, "winter_months": [12, 1, 2]}
+
+        calculator = VentilationCalculator.get(config)
+
+        assert VentilationCalculator.get(dict(config)) is calculator
+        assert VentilationCalculator.get({}) is not calculator
+        assert calculator.config == config
+
+    def test_get_builds_from_the_config_passed_in(self) -> None:
+        """Test the shared calculator keeps the config types and key types."""
+        config = {
+            CONF_ADVANCED_SETTINGS: {
+                CONF_SCORE_WEIGHTS: DEFAULT_SCORE_WEIGHTS,
+            },
+            "winter_months": (12, 1, 2),
+            "custom": {1: "one"},
+        }
+
+        calculator = VentilationCalculator.get(config)
+
+        assert calculator.config == {
+            CONF_ADVANCED_SETTINGS: {
+                CONF_SCORE_WEIGHTS: dict(DEFAULT_SCORE_WEIGHTS),
+            },
+            "winter_months": (12, 1, 2),
+            "custom": {1: "one"},
+        }
+        list_config = {**config, "winter_months": [12, 1, 2]}
+        assert VentilationCalculator.get(list_config) is not calculator
+
+    def test_get_config_is_read_only(self) -> None:
+        """Test callers cannot change the config of a shared calculator."""
+        config: dict[str, Any] = {
+            "enable_wind_factor": False,
+            CONF_ADVANCED_SETTINGS: {CONF_CO2_THRESHOLDS: {"poor": 900}},
+            "custom": {1, 2},
+        }
+        calculator = VentilationCalculator.get(config)
+
+        config["enable_wind_factor"] = True
+        config[CONF_ADVANCED_SETTINGS][CONF_CO2_THRESHOLDS]["poor"] = 950
+        config["custom"].add(3)
+        with pytest.raises(TypeError):
+            calculator.config["enable_wind_factor"] = True  # type: ignore[index]
+        with pytest.raises(TypeError):
+            calculator.config[CONF_ADVANCED_SETTINGS][CONF_CO2_THRESHOLDS] = {}
+
+        assert calculator.config == {
+            "enable_wind_factor": False,
+            CONF_ADVANCED_SETTINGS: {CONF_CO2_THRESHOLDS: {"poor": 900}},
+            "custom": {1, 2},
+        }
+
+    def test_get_unhashable_config_is_not_cached(self) -> None:
+        """Test a config with unhashable values still builds a calculator."""
+        config = {"custom": bytearray(b"x")}
+
+        calculator = VentilationCalculator.get(config)
+
+        assert VentilationCalculator.get(config) is not calculator
+        assert calculator.config == config
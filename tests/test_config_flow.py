@@ -2,10 +2,13 @@
 
 # pyright: reportTypedDictNotRequiredAccess=false,reportOptionalSubscript=false,reportOperatorIssue=false,reportArgumentType=false,reportAttributeAccessIssue=false
 
-import os
+from collections.abc import Callable, Mapping
+from typing import Any
 from unittest.mock import AsyncMock
 
+import pytest
 import voluptuous_serialize as vserialize
+from homeassistant.config_entries import ConfigFlowResult
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
 from pytest_homeassistant_custom_component.common import MockConfigEntry
@@ -25,16 +28,133 @@ from custom_components.room_ventilation_advisor.const import (
     CONF_OUTDOOR_HUMIDITY_SENSOR,
     CONF_OUTDOOR_TEMP_SENSOR,
     CONF_ROOM_NAME,
+    CONF_ROOM_TIME_PATTERNS,
     CONF_ROOM_TYPE,
     CONF_ROOMS,
     CONF_SCAN_INTERVAL,
     CONF_SCORE_WEIGHTS,
     CONF_TEMP_SENSOR,
     CONF_TEMPERATURE_THRESHOLDS,
+    CONF_TIME_FACTORS,
     CONF_WIND_SENSOR,
     CONF_WIND_THRESHOLDS,
+    DEFAULT_CO2_THRESHOLDS,
 )
 
+OptionsFlowFactory = Callable[[MockConfigEntry], RoomVentilationAdvisorOptionsFlow]
+
+
+@pytest.fixture
+def living_room_config() -> dict[str, Any]:
+    """Return the stored living room most options flow tests start from."""
+    return {
+        CONF_ROOM_NAME: "Living Room",
+        CONF_TEMP_SENSOR: "sensor.living_temp",
+        CONF_HUMIDITY_SENSOR: "sensor.living_humidity",
+        CONF_ROOM_TYPE: "living_room",
+        CONF_CO2_SENSOR: "sensor.living_co2",
+        CONF_ENABLED: True,
+    }
+
+
+@pytest.fixture
+def user_step_input() -> dict[str, Any]:
+    """Return the form input for the user step of the config flow."""
+    return {
+        "name": "Test Advisor",
+        "outdoor_temp_sensor": "sensor.outdoor_temperature",
+        "outdoor_humidity_sensor": "sensor.outdoor_humidity",
+        "wind_sensor": "sensor.wind_speed",
+        "scan_interval": 300,
+    }
+
+
+@pytest.fixture
+def room_setup_input() -> dict[str, Any]:
+    """Return the form input that sets up a living room in the config flow."""
+    return {
+        "room_name": "Living Room",
+        "temp_sensor": "sensor.living_room_temperature",
+        "humidity_sensor": "sensor.living_room_humidity",
+        "room_type": "living_room",
+        "co2_sensor": "sensor.living_room_co2",
+        "enabled": True,
+        "add_another_room": False,
+    }
+
+
+def _assert_form(result: ConfigFlowResult, step_id: str) -> None:
+    """Assert that a flow result shows the form of the given step."""
+    assert (result["type"], result["step_id"]) == (FlowResultType.FORM, step_id)
+
+
+async def _async_submit_advanced(
+    flow: RoomVentilationAdvisorOptionsFlow,
+    advanced: dict[str, Any],
+) -> dict[str, Any]:
+    """Submit advanced settings and return the advanced settings stored."""
+    result = await flow.async_step_advanced({CONF_ADVANCED_SETTINGS: advanced})
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    return result["data"][CONF_ADVANCED_SETTINGS]
+
+
+@pytest.fixture
+async def post_user_flow(
+    hass: HomeAssistant,
+    user_step_input: dict[str, Any],
+) -> RoomVentilationAdvisorConfigFlow:
+    """Return a config flow that has completed the user step."""
+    flow = RoomVentilationAdvisorConfigFlow()
+    flow.hass = hass
+    await flow.async_step_user(user_step_input)
+    return flow
+
+
+@pytest.fixture
+def single_room_config() -> dict[str, Any]:
+    """Return the stored "Test Room" used by the schema tests."""
+    return {
+        CONF_ROOM_TYPE: "living_room",
+        CONF_HUMIDITY_SENSOR: "sensor.humidity",
+        CONF_TEMP_SENSOR: "sensor.temperature",
+        CONF_CO2_SENSOR: None,
+        CONF_ENABLED: True,
+    }
+
+
+@pytest.fixture
+def stored_rooms(
+    living_room_config: dict[str, Any],
+    single_room_config: dict[str, Any],
+) -> dict[str, dict[str, Any]]:
+    """Return the stored rooms the remove room tests pick from, by name."""
+    return {
+        "Living Room": living_room_config,
+        "Kitchen": {
+            CONF_ROOM_NAME: "Kitchen",
+            CONF_TEMP_SENSOR: "sensor.kitchen_temp",
+            CONF_HUMIDITY_SENSOR: "sensor.kitchen_humidity",
+            CONF_ROOM_TYPE: "kitchen",
+        },
+        "Test Room": single_room_config,
+    }
+
+
+@pytest.fixture
+def single_room_entry(
+    hass: HomeAssistant,
+    single_room_config: dict[str, Any],
+) -> MockConfigEntry:
+    """Return a config entry with a single "Test Room", added to hass."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            CONF_ROOMS: {"Test Room": single_room_config},
+        },
+    )
+    config_entry.add_to_hass(hass)
+    return config_entry
+
 
 class TestRoomVentilationAdvisorConfigFlow:
     """Test the config flow."""
@@ -47,96 +167,47 @@ class TestRoomVentilationAdvisorConfigFlow:
 
         result = await flow.async_step_user()
 
-        assert result is not None
-        assert "type" in result
-        assert "step_id" in result
-        assert result["type"] == FlowResultType.FORM
-        assert result["step_id"] == "user"
+        _assert_form(result, "user")
 
-    async def test_config_flow_user_step_valid_data(self, hass: HomeAssistant) -> None:
+    async def test_config_flow_user_step_valid_data(
+        self,
+        hass: HomeAssistant,
+        user_step_input: dict[str, Any],
+    ) -> None:
         """Test the user step with valid data."""
         flow = RoomVentilationAdvisorConfigFlow()
         flow.hass = hass
 
-        user_input = {
-            "name": "Test Advisor",
-            "outdoor_temp_sensor": "sensor.outdoor_temperature",
-            "outdoor_humidity_sensor": "sensor.outdoor_humidity",
-            "wind_sensor": "sensor.wind_speed",
-            "scan_interval": 300,
-        }
-
-        result = await flow.async_step_user(user_input)
+        result = await flow.async_step_user(user_step_input)
 
-        assert result["type"] == FlowResultType.FORM
-        assert result["step_id"] == "room_setup"
+        _assert_form(result, "room_setup")
 
-    async def test_config_flow_room_setup_step(self, hass: HomeAssistant) -> None:
+    async def test_config_flow_room_setup_step(
+        self,
+        post_user_flow: RoomVentilationAdvisorConfigFlow,
+        room_setup_input: dict[str, Any],
+    ) -> None:
         """Test the room setup step."""
-        flow = RoomVentilationAdvisorConfigFlow()
-        flow.hass = hass
+        flow = post_user_flow
 
-        # First complete the user step
-        user_input = {
-            "name": "Test Advisor",
-            "outdoor_temp_sensor": "sensor.outdoor_temperature",
-            "outdoor_humidity_sensor": "sensor.outdoor_humidity",
-            "wind_sensor": "sensor.wind_speed",
-            "scan_interval": 300,
-        }
-
-        await flow.async_step_user(user_input)
-
-        # Now test the room setup step
         result = await flow.async_step_room_setup()
 
-        assert result["type"] == FlowResultType.FORM
-        assert result["step_id"] == "room_setup"
+        _assert_form(result, "room_setup")
 
         # Test with a single room
-        room_input = {
-            "room_name": "Living Room",
-            "temp_sensor": "sensor.living_room_temperature",
-            "humidity_sensor": "sensor.living_room_humidity",
-            "room_type": "living_room",
-            "co2_sensor": "sensor.living_room_co2",
-            "enabled": True,
-            "add_another_room": False,
-        }
-
-        result = await flow.async_step_room_setup(room_input)
+        result = await flow.async_step_room_setup(room_setup_input)
 
         assert result["type"] == FlowResultType.CREATE_ENTRY
         assert result["data"]["name"] == "Test Advisor"
 
-    async def test_config_flow_with_rooms(self, hass: HomeAssistant) -> None:
+    async def test_config_flow_with_rooms(
+        self,
+        post_user_flow: RoomVentilationAdvisorConfigFlow,
+        room_setup_input: dict[str, Any],
+    ) -> None:
         """Test the config flow with room configuration."""
-        flow = RoomVentilationAdvisorConfigFlow()
-        flow.hass = hass
-
-        # Complete user step
-        user_input = {
-            "name": "Test Advisor",
-            "outdoor_temp_sensor": "sensor.outdoor_temperature",
-            "outdoor_humidity_sensor": "sensor.outdoor_humidity",
-            "wind_sensor": "sensor.wind_speed",
-            "scan_interval": 300,
-        }
-
-        await flow.async_step_user(user_input)
-
         # Configure a room
-        room_input = {
-            "room_name": "Living Room",
-            "temp_sensor": "sensor.living_room_temperature",
-            "humidity_sensor": "sensor.living_room_humidity",
-            "room_type": "living_room",
-            "co2_sensor": "sensor.living_room_co2",
-            "enabled": True,
-            "add_another_room": False,
-        }
-
-        result = await flow.async_step_room_setup(room_input)
+        result = await post_user_flow.async_step_room_setup(room_setup_input)
 
         assert result["type"] == FlowResultType.CREATE_ENTRY
         assert len(result["data"][CONF_ROOMS]) == 1
@@ -146,52 +217,42 @@ class TestRoomVentilationAdvisorConfigFlow:
 class TestRoomVentilationAdvisorOptionsFlow:
     """Test the options flow."""
 
-    async def test_options_flow_init(self, hass: HomeAssistant) -> None:
+    async def test_options_flow_init(
+        self,
+        make_options_flow: OptionsFlowFactory,
+        base_entry_data: Mapping[str, Any],
+    ) -> None:
         """Test options flow initialization."""
         config_entry = MockConfigEntry(
             domain=DOMAIN,
-            data={
-                "name": "Test Advisor",
-                "outdoor_temp_sensor": "sensor.outdoor_temp",
-                "outdoor_humidity_sensor": "sensor.outdoor_humidity",
-                "wind_sensor": "sensor.wind_speed",
-                "scan_interval": 300,
-                CONF_ROOMS: {},
-            },
+            data=dict(base_entry_data),
             options={},
         )
 
-        flow = RoomVentilationAdvisorOptionsFlow(config_entry)
-        flow.hass = hass
+        flow = make_options_flow(config_entry)
 
         result = await flow.async_step_init()
 
-        assert result["type"] == FlowResultType.FORM
-        assert result["step_id"] == "init"
+        _assert_form(result, "init")
 
-    async def test_options_flow_basic_settings(self, hass: HomeAssistant) -> None:
+    async def test_options_flow_basic_settings(
+        self,
+        make_options_flow: OptionsFlowFactory,
+        base_entry_data: Mapping[str, Any],
+    ) -> None:
         """Test basic settings configuration."""
         config_entry = MockConfigEntry(
             domain=DOMAIN,
-            data={
-                "name": "Test Advisor",
-                "outdoor_temp_sensor": "sensor.outdoor_temp",
-                "outdoor_humidity_sensor": "sensor.outdoor_humidity",
-                "wind_sensor": "sensor.wind_speed",
-                "scan_interval": 300,
-                CONF_ROOMS: {},
-            },
+            data=dict(base_entry_data),
             options={},
         )
 
-        flow = RoomVentilationAdvisorOptionsFlow(config_entry)
-        flow.hass = hass
+        flow = make_options_flow(config_entry)
 
         # Navigate to basic settings
         result = await flow.async_step_init({"configure_basic": True})
 
-        assert result["type"] == FlowResultType.FORM
-        assert result["step_id"] == "basic"
+        _assert_form(result, "basic")
 
         # Configure basic settings
         basic_input = {
@@ -206,38 +267,28 @@ class TestRoomVentilationAdvisorOptionsFlow:
 
     async def test_options_flow_basic_sensor_configuration(
         self,
-        hass: HomeAssistant,
+        make_options_flow: OptionsFlowFactory,
+        base_entry_data: Mapping[str, Any],
+        living_room_config: dict[str, Any],
     ) -> None:
         """Test basic sensor configuration in options flow."""
         config_entry = MockConfigEntry(
             domain=DOMAIN,
             data={
-                "name": "Test Advisor",
-                "outdoor_temp_sensor": "sensor.outdoor_temp",
-                "outdoor_humidity_sensor": "sensor.outdoor_humidity",
-                "wind_sensor": "sensor.wind_speed",
-                "scan_interval": 300,
+                **base_entry_data,
                 CONF_ROOMS: {
-                    "Living Room": {
-                        "temp_sensor": "sensor.living_temp",
-                        "humidity_sensor": "sensor.living_humidity",
-                        "co2_sensor": "sensor.living_co2",
-                        "room_type": "living_room",
-                        "enabled": True,
-                    },
+                    "Living Room": living_room_config,
                 },
             },
             options={},
         )
 
-        flow = RoomVentilationAdvisorOptionsFlow(config_entry)
-        flow.hass = hass
+        flow = make_options_flow(config_entry)
 
         # Navigate to basic settings
         result = await flow.async_step_init({"configure_basic": True})
 
-        assert result["type"] == FlowResultType.FORM
-        assert result["step_id"] == "basic"
+        _assert_form(result, "basic")
 
         # Configure all basic settings (only global sensors)
         basic_input = {
@@ -251,45 +302,35 @@ class TestRoomVentilationAdvisorOptionsFlow:
         result = await flow.async_step_basic(basic_input)
 
         assert result["type"] == FlowResultType.CREATE_ENTRY
-        # Check outdoor sensors
-        assert result["data"][CONF_OUTDOOR_TEMP_SENSOR] == "sensor.new_outdoor_temp"
-        assert (
-            result["data"][CONF_OUTDOOR_HUMIDITY_SENSOR]
-            == "sensor.new_outdoor_humidity"
-        )
-        assert result["data"][CONF_WIND_SENSOR] == "sensor.new_wind_speed"
-        assert result["data"][CONF_SCAN_INTERVAL] == 600
-        assert result["data"]["enable_wind_factor"] is False
+        options = result["data"]
         # Room settings should not be in basic options
-        assert "room_settings" not in result["data"]
+        assert "room_settings" not in options
+        # Outdoor sensors and global settings are stored as submitted
+        assert options == basic_input
 
-    async def test_options_flow_advanced_settings(self, hass: HomeAssistant) -> None:
+    async def test_options_flow_advanced_settings(
+        self,
+        make_options_flow: OptionsFlowFactory,
+        base_entry_data: Mapping[str, Any],
+    ) -> None:
         """Test advanced settings configuration."""
         config_entry = MockConfigEntry(
             domain=DOMAIN,
-            data={
-                "name": "Test Advisor",
-                "outdoor_temp_sensor": "sensor.outdoor_temp",
-                "outdoor_humidity_sensor": "sensor.outdoor_humidity",
-                "wind_sensor": "sensor.wind_speed",
-                "scan_interval": 300,
-                CONF_ROOMS: {},
-            },
+            data=dict(base_entry_data),
             options={},
         )
 
-        flow = RoomVentilationAdvisorOptionsFlow(config_entry)
-        flow.hass = hass
+        flow = make_options_flow(config_entry)
 
         # Navigate to advanced settings
         result = await flow.async_step_init({"configure_advanced": True})
 
-        assert result["type"] == FlowResultType.FORM
-        assert result["step_id"] == "advanced"
+        _assert_form(result, "advanced")
 
     async def test_options_flow_advanced_schema_serializable(
         self,
-        hass: HomeAssistant,
+        make_options_flow: OptionsFlowFactory,
+        base_entry_data: Mapping[str, Any],
     ) -> None:
         """
         Ensure advanced options schema can be serialized to JSON.
@@ -301,58 +342,79 @@ class TestRoomVentilationAdvisorOptionsFlow:
         """
         config_entry = MockConfigEntry(
             domain=DOMAIN,
-            data={
-                "name": "Test Advisor",
-                "outdoor_temp_sensor": "sensor.outdoor_temp",
-                "outdoor_humidity_sensor": "sensor.outdoor_humidity",
-                "wind_sensor": "sensor.wind_speed",
-                "scan_interval": 300,
-                CONF_ROOMS: {},
-            },
+            data=dict(base_entry_data),
             options={},
         )
 
-        flow = RoomVentilationAdvisorOptionsFlow(config_entry)
-        flow.hass = hass
+        flow = make_options_flow(config_entry)
 
         # Navigate to advanced settings and get the schema
         result = await flow.async_step_init({"configure_advanced": True})
-        assert result["type"] == FlowResultType.FORM
-        assert result["step_id"] == "advanced"
+        _assert_form(result, "advanced")
 
         # Try to serialize the schema the same way the UI does
         schema = result["data_schema"]
         # should not raise
         vserialize.convert(schema)
 
-    async def test_options_flow_temperature_thresholds(
+    @pytest.mark.parametrize(
+        "stored_advanced",
+        [
+            {
+                CONF_TIME_FACTORS: [0.2, 0.5, 1.0],
+                CONF_ROOM_TIME_PATTERNS: {"bedroom": [22, 23, 0]},
+                CONF_HUMIDITY_THRESHOLDS: {"good": 3.0, "moderate": 1.5},
+            },
+            {
+                CONF_CO2_THRESHOLDS: "not a group",
+                CONF_WIND_THRESHOLDS: {"no_effect": [10.0]},
+                CONF_HUMIDITY_THRESHOLDS: {"good": 3.0, "moderate": 1.5},
+            },
+        ],
+    )
+    async def test_options_flow_advanced_with_unusual_stored_groups(
         self,
-        hass: HomeAssistant,
+        make_options_flow: OptionsFlowFactory,
+        base_entry_data: Mapping[str, Any],
+        stored_advanced: dict[str, Any],
     ) -> None:
-        """Test updating temperature thresholds."""
+        """Test the advanced step opens with list-valued or non-dict groups stored."""
         config_entry = MockConfigEntry(
             domain=DOMAIN,
-            data={
-                "name": "Test Advisor",
-                "outdoor_temp_sensor": "sensor.outdoor_temp",
-                "outdoor_humidity_sensor": "sensor.outdoor_humidity",
-                "wind_sensor": "sensor.wind_speed",
-                "scan_interval": 300,
-                CONF_ROOMS: {},
-            },
-            options={},
+            data=dict(base_entry_data),
+            options={CONF_ADVANCED_SETTINGS: stored_advanced},
         )
+        flow = make_options_flow(config_entry)
 
-        flow = RoomVentilationAdvisorOptionsFlow(config_entry)
-        flow.hass = hass
+        result = await flow.async_step_advanced()
 
-        # Navigate to advanced settings
-        await flow.async_step_init({"configure_advanced": True})
+        _assert_form(result, "advanced")
+        defaults = {str(key): key.default() for key in result["data_schema"].schema}
+        assert defaults["humidity_good"] == 3.0
+        assert defaults["co2_poor"] == DEFAULT_CO2_THRESHOLDS["poor"]
 
-        # Update temperature thresholds
-        advanced_input = {
-            CONF_ADVANCED_SETTINGS: {
-                CONF_TEMPERATURE_THRESHOLDS: {
+    async def test_options_flow_advanced_schema_reused(
+        self,
+        make_options_flow: OptionsFlowFactory,
+        base_entry_data: Mapping[str, Any],
+    ) -> None:
+        """Test flows with equal advanced settings share one schema object."""
+        schemas = []
+        for _ in range(2):
+            flow = make_options_flow(
+                MockConfigEntry(domain=DOMAIN, data=dict(base_entry_data)),
+            )
+            result = await flow.async_step_advanced()
+            schemas.append(result["data_schema"])
+
+        assert schemas[0] is schemas[1]
+
+    @pytest.mark.parametrize(
+        ("section", "payload"),
+        [
+            (
+                CONF_TEMPERATURE_THRESHOLDS,
+                {
                     "winter_good": 4.0,
                     "winter_moderate": 2.0,
                     "summer_good": 5.0,
@@ -360,181 +422,40 @@ class TestRoomVentilationAdvisorOptionsFlow:
                     "default_good": 4.5,
                     "default_moderate": 2.5,
                 },
-            },
-        }
-
-        result = await flow.async_step_advanced(advanced_input)
-
-        assert result["type"] == FlowResultType.CREATE_ENTRY
-        temp_thresholds = result["data"][CONF_ADVANCED_SETTINGS][
-            CONF_TEMPERATURE_THRESHOLDS
-        ]
-        assert temp_thresholds["winter_good"] == 4.0
-        assert temp_thresholds["winter_moderate"] == 2.0
-
-    async def test_options_flow_humidity_thresholds(self, hass: HomeAssistant) -> None:
-        """Test updating humidity thresholds."""
-        config_entry = MockConfigEntry(
-            domain=DOMAIN,
-            data={
-                "name": "Test Advisor",
-                "outdoor_temp_sensor": "sensor.outdoor_temp",
-                "outdoor_humidity_sensor": "sensor.outdoor_humidity",
-                "wind_sensor": "sensor.wind_speed",
-                "scan_interval": 300,
-                CONF_ROOMS: {},
-            },
-            options={},
-        )
-
-        flow = RoomVentilationAdvisorOptionsFlow(config_entry)
-        flow.hass = hass
-
-        # Navigate to advanced settings
-        await flow.async_step_init({"configure_advanced": True})
-
-        # Update humidity thresholds
-        advanced_input = {
-            CONF_ADVANCED_SETTINGS: {
-                CONF_HUMIDITY_THRESHOLDS: {
-                    "good": 3.0,
-                    "moderate": 1.5,
-                },
-            },
-        }
-
-        result = await flow.async_step_advanced(advanced_input)
-
-        assert result["type"] == FlowResultType.CREATE_ENTRY
-        humidity_thresholds = result["data"][CONF_ADVANCED_SETTINGS][
-            CONF_HUMIDITY_THRESHOLDS
-        ]
-        assert humidity_thresholds["good"] == 3.0
-        assert humidity_thresholds["moderate"] == 1.5
-
-    async def test_options_flow_co2_thresholds(self, hass: HomeAssistant) -> None:
-        """Test updating CO2 thresholds."""
-        config_entry = MockConfigEntry(
-            domain=DOMAIN,
-            data={
-                "name": "Test Advisor",
-                "outdoor_temp_sensor": "sensor.outdoor_temp",
-                "outdoor_humidity_sensor": "sensor.outdoor_humidity",
-                "wind_sensor": "sensor.wind_speed",
-                "scan_interval": 300,
-                CONF_ROOMS: {},
-            },
-            options={},
-        )
-
-        flow = RoomVentilationAdvisorOptionsFlow(config_entry)
-        flow.hass = hass
-
-        # Navigate to advanced settings
-        await flow.async_step_init({"configure_advanced": True})
-
-        # Update CO2 thresholds
-        advanced_input = {
-            CONF_ADVANCED_SETTINGS: {
-                CONF_CO2_THRESHOLDS: {
-                    "very_poor": 1600,
-                    "poor": 1400,
-                    "moderate": 900,
-                },
-            },
-        }
-
-        result = await flow.async_step_advanced(advanced_input)
-
-        assert result["type"] == FlowResultType.CREATE_ENTRY
-        co2_thresholds = result["data"][CONF_ADVANCED_SETTINGS][CONF_CO2_THRESHOLDS]
-        assert co2_thresholds["very_poor"] == 1600
-        assert co2_thresholds["poor"] == 1400
-        assert co2_thresholds["moderate"] == 900
-
-    async def test_options_flow_wind_thresholds(self, hass: HomeAssistant) -> None:
-        """Test updating wind thresholds."""
-        config_entry = MockConfigEntry(
-            domain=DOMAIN,
-            data={
-                "name": "Test Advisor",
-                "outdoor_temp_sensor": "sensor.outdoor_temp",
-                "outdoor_humidity_sensor": "sensor.outdoor_humidity",
-                "wind_sensor": "sensor.wind_speed",
-                "scan_interval": 300,
-                CONF_ROOMS: {},
-            },
-            options={},
-        )
-
-        flow = RoomVentilationAdvisorOptionsFlow(config_entry)
-        flow.hass = hass
-
-        # Navigate to advanced settings
-        await flow.async_step_init({"configure_advanced": True})
-
-        # Update wind thresholds
-        advanced_input = {
-            CONF_ADVANCED_SETTINGS: {
-                CONF_WIND_THRESHOLDS: {
-                    "no_effect": 15.0,
-                    "moderate_effect": 25.0,
-                },
-            },
-        }
-
-        result = await flow.async_step_advanced(advanced_input)
-
-        assert result["type"] == FlowResultType.CREATE_ENTRY
-        wind_thresholds = result["data"][CONF_ADVANCED_SETTINGS][CONF_WIND_THRESHOLDS]
-        assert wind_thresholds["no_effect"] == 15.0
-        assert wind_thresholds["moderate_effect"] == 25.0
-
-    async def test_options_flow_score_weights(self, hass: HomeAssistant) -> None:
-        """Test updating score weights."""
+            ),
+            (CONF_HUMIDITY_THRESHOLDS, {"good": 3.0, "moderate": 1.5}),
+            (CONF_CO2_THRESHOLDS, {"very_poor": 1600, "poor": 1400, "moderate": 900}),
+            (CONF_WIND_THRESHOLDS, {"no_effect": 15.0, "moderate_effect": 25.0}),
+            (
+                CONF_SCORE_WEIGHTS,
+                {"temperature": 0.4, "humidity": 0.3, "co2": 0.2, "time": 0.1},
+            ),
+        ],
+    )
+    async def test_options_flow_advanced_section(
+        self,
+        make_options_flow: OptionsFlowFactory,
+        base_entry_data: Mapping[str, Any],
+        section: str,
+        payload: dict[str, float],
+    ) -> None:
+        """Test updating one advanced settings section."""
         config_entry = MockConfigEntry(
             domain=DOMAIN,
-            data={
-                "name": "Test Advisor",
-                "outdoor_temp_sensor": "sensor.outdoor_temp",
-                "outdoor_humidity_sensor": "sensor.outdoor_humidity",
-                "wind_sensor": "sensor.wind_speed",
-                "scan_interval": 300,
-                CONF_ROOMS: {},
-            },
+            data=dict(base_entry_data),
             options={},
         )
 
-        flow = RoomVentilationAdvisorOptionsFlow(config_entry)
-        flow.hass = hass
+        flow = make_options_flow(config_entry)
 
-        # Navigate to advanced settings
-        await flow.async_step_init({"configure_advanced": True})
-
-        # Update score weights
-        advanced_input = {
-            CONF_ADVANCED_SETTINGS: {
-                CONF_SCORE_WEIGHTS: {
-                    "temperature": 0.4,
-                    "humidity": 0.3,
-                    "co2": 0.2,
-                    "time": 0.1,
-                },
-            },
-        }
-
-        result = await flow.async_step_advanced(advanced_input)
+        advanced = await _async_submit_advanced(flow, {section: payload})
 
-        assert result["type"] == FlowResultType.CREATE_ENTRY
-        score_weights = result["data"][CONF_ADVANCED_SETTINGS][CONF_SCORE_WEIGHTS]
-        assert score_weights["temperature"] == 0.4
-        assert score_weights["humidity"] == 0.3
-        assert score_weights["co2"] == 0.2
-        assert score_weights["time"] == 0.1
+        assert advanced[section] == payload
 
     async def test_options_flow_with_existing_settings(
         self,
-        hass: HomeAssistant,
+        make_options_flow: OptionsFlowFactory,
+        base_entry_data: Mapping[str, Any],
     ) -> None:
         """Test options flow with existing advanced settings."""
         existing_advanced = {
@@ -546,37 +467,25 @@ class TestRoomVentilationAdvisorOptionsFlow:
 
         config_entry = MockConfigEntry(
             domain=DOMAIN,
-            data={
-                "name": "Test Advisor",
-                "outdoor_temp_sensor": "sensor.outdoor_temp",
-                "outdoor_humidity_sensor": "sensor.outdoor_humidity",
-                "wind_sensor": "sensor.wind_speed",
-                "scan_interval": 300,
-                CONF_ROOMS: {},
-            },
+            data=dict(base_entry_data),
             options={CONF_ADVANCED_SETTINGS: existing_advanced},
         )
 
-        flow = RoomVentilationAdvisorOptionsFlow(config_entry)
-        flow.hass = hass
+        flow = make_options_flow(config_entry)
 
         result = await flow.async_step_init()
 
-        assert result["type"] == FlowResultType.FORM
-        assert result["step_id"] == "init"
+        _assert_form(result, "init")
 
-    async def test_options_flow_partial_update(self, hass: HomeAssistant) -> None:
+    async def test_options_flow_partial_update(
+        self,
+        make_options_flow: OptionsFlowFactory,
+        base_entry_data: Mapping[str, Any],
+    ) -> None:
         """Test partial update of advanced settings."""
         config_entry = MockConfigEntry(
             domain=DOMAIN,
-            data={
-                "name": "Test Advisor",
-                "outdoor_temp_sensor": "sensor.outdoor_temp",
-                "outdoor_humidity_sensor": "sensor.outdoor_humidity",
-                "wind_sensor": "sensor.wind_speed",
-                "scan_interval": 300,
-                CONF_ROOMS: {},
-            },
+            data=dict(base_entry_data),
             options={
                 CONF_ADVANCED_SETTINGS: {
                     CONF_TEMPERATURE_THRESHOLDS: {
@@ -586,105 +495,81 @@ class TestRoomVentilationAdvisorOptionsFlow:
             },
         )
 
-        flow = RoomVentilationAdvisorOptionsFlow(config_entry)
-        flow.hass = hass
-
-        # Navigate to advanced settings
-        await flow.async_step_init({"configure_advanced": True})
+        flow = make_options_flow(config_entry)
 
         # Update only humidity thresholds, keep temperature
-        advanced_input = {
-            CONF_ADVANCED_SETTINGS: {
+        advanced = await _async_submit_advanced(
+            flow,
+            {
                 CONF_HUMIDITY_THRESHOLDS: {
                     "good": 2.0,
                     "moderate": 0.5,
                 },
             },
-        }
-
-        result = await flow.async_step_advanced(advanced_input)
+        )
 
-        assert result["type"] == FlowResultType.CREATE_ENTRY
         # Check that temperature threshold is preserved
-        assert (
-            result["data"][CONF_ADVANCED_SETTINGS][CONF_TEMPERATURE_THRESHOLDS][
-                "winter_good"
-            ]
-            == 2.0
-        )
+        assert advanced[CONF_TEMPERATURE_THRESHOLDS]["winter_good"] == 2.0
         # Check that humidity thresholds are updated
-        assert (
-            result["data"][CONF_ADVANCED_SETTINGS][CONF_HUMIDITY_THRESHOLDS]["good"]
-            == 2.0
-        )
+        assert advanced[CONF_HUMIDITY_THRESHOLDS]["good"] == 2.0
+        # The entry options are only replaced when the flow result is saved
+        stored = config_entry.options[CONF_ADVANCED_SETTINGS]
+        assert CONF_HUMIDITY_THRESHOLDS not in stored
 
-    async def test_options_flow_room_management_menu(self, hass: HomeAssistant) -> None:
+    async def test_options_flow_room_management_menu(
+        self,
+        make_options_flow: OptionsFlowFactory,
+        base_entry_data: Mapping[str, Any],
+        living_room_config: dict[str, Any],
+    ) -> None:
         """Test room management menu navigation."""
         config_entry = MockConfigEntry(
             domain=DOMAIN,
             data={
-                "name": "Test Advisor",
-                "outdoor_temp_sensor": "sensor.outdoor_temp",
-                "outdoor_humidity_sensor": "sensor.outdoor_humidity",
-                "wind_sensor": "sensor.wind_speed",
-                "scan_interval": 300,
+                **base_entry_data,
                 CONF_ROOMS: {
-                    "Living Room": {
-                        CONF_ROOM_NAME: "Living Room",
-                        CONF_TEMP_SENSOR: "sensor.living_temp",
-                        CONF_HUMIDITY_SENSOR: "sensor.living_humidity",
-                        CONF_ROOM_TYPE: "living_room",
-                        CONF_CO2_SENSOR: "sensor.living_co2",
-                        CONF_ENABLED: True,
-                    },
+                    "Living Room": living_room_config,
                 },
             },
             options={},
         )
 
-        flow = RoomVentilationAdvisorOptionsFlow(config_entry)
-        flow.hass = hass
+        flow = make_options_flow(config_entry)
 
         # Navigate to room management
         result = await flow.async_step_init({"configure_rooms": True})
 
-        assert result["type"] == FlowResultType.FORM
-        assert result["step_id"] == "rooms"
+        _assert_form(result, "rooms")
 
-    async def test_options_flow_add_room(self, hass: HomeAssistant) -> None:
+    async def test_options_flow_add_room(
+        self,
+        hass: HomeAssistant,
+        make_options_flow: OptionsFlowFactory,
+        base_entry_data: Mapping[str, Any],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
         """Test adding a new room through options flow."""
         config_entry = MockConfigEntry(
             domain=DOMAIN,
-            data={
-                "name": "Test Advisor",
-                "outdoor_temp_sensor": "sensor.outdoor_temp",
-                "outdoor_humidity_sensor": "sensor.outdoor_humidity",
-                "wind_sensor": "sensor.wind_speed",
-                "scan_interval": 300,
-                CONF_ROOMS: {},
-            },
+            data=dict(base_entry_data),
             options={},
         )
         config_entry.add_to_hass(hass)
 
-        flow = RoomVentilationAdvisorOptionsFlow(config_entry)
-        flow.hass = hass
+        flow = make_options_flow(config_entry)
 
         # Mock the async_reload method to verify it's called
         mock_reload = AsyncMock()
         flow.hass.config_entries.async_reload = mock_reload
 
         # Mock the environment to simulate production (not testing)
-
-        original_env = os.environ.get("PYTEST_CURRENT_TEST")
-        os.environ.pop("PYTEST_CURRENT_TEST", None)
+        monkeypatch.delenv("PYTEST_CURRENT_TEST", raising=False)
 
         # Navigate to rooms step
         await flow.async_step_init({"configure_rooms": True})
         result = await flow.async_step_rooms({"add_room": True})
 
-        assert result["type"] == FlowResultType.FORM
-        assert result["step_id"] == "add_room"
+        _assert_form(result, "add_room")
 
         # Add a room
         room_data = {
@@ -708,10 +593,6 @@ class TestRoomVentilationAdvisorOptionsFlow:
 
         # Verify that async_reload was called to update sensors
         mock_reload.assert_called_once_with(config_entry.entry_id)
-
-        # Restore the environment variable
-        if original_env is not None:
-            os.environ["PYTEST_CURRENT_TEST"] = original_env
         assert updated_data[CONF_ROOMS]["Kitchen"][CONF_ROOM_NAME] == "Kitchen"
         assert (
             updated_data[CONF_ROOMS]["Kitchen"][CONF_TEMP_SENSOR]
@@ -721,31 +602,24 @@ class TestRoomVentilationAdvisorOptionsFlow:
     async def test_options_flow_add_room_duplicate_name(
         self,
         hass: HomeAssistant,
+        make_options_flow: OptionsFlowFactory,
+        base_entry_data: Mapping[str, Any],
+        living_room_config: dict[str, Any],
     ) -> None:
         """Test adding a room with duplicate name."""
         config_entry = MockConfigEntry(
             domain=DOMAIN,
             data={
-                "name": "Test Advisor",
-                "outdoor_temp_sensor": "sensor.outdoor_temp",
-                "outdoor_humidity_sensor": "sensor.outdoor_humidity",
-                "wind_sensor": "sensor.wind_speed",
-                "scan_interval": 300,
+                **base_entry_data,
                 CONF_ROOMS: {
-                    "Living Room": {
-                        CONF_ROOM_NAME: "Living Room",
-                        CONF_TEMP_SENSOR: "sensor.living_temp",
-                        CONF_HUMIDITY_SENSOR: "sensor.living_humidity",
-                        CONF_ROOM_TYPE: "living_room",
-                    },
+                    "Living Room": living_room_config,
                 },
             },
             options={},
         )
         config_entry.add_to_hass(hass)
 
-        flow = RoomVentilationAdvisorOptionsFlow(config_entry)
-        flow.hass = hass
+        flow = make_options_flow(config_entry)
 
         # Navigate to add room
         await flow.async_step_init({"configure_rooms": True})
@@ -761,38 +635,31 @@ class TestRoomVentilationAdvisorOptionsFlow:
 
         result = await flow.async_step_add_room(room_data)
 
-        assert result["type"] == FlowResultType.FORM
-        assert result["step_id"] == "add_room"
+        _assert_form(result, "add_room")
         assert "errors" in result
         assert "room_name" in result["errors"]
 
-    async def test_options_flow_edit_room(self, hass: HomeAssistant) -> None:
+    async def test_options_flow_edit_room(
+        self,
+        hass: HomeAssistant,
+        make_options_flow: OptionsFlowFactory,
+        base_entry_data: Mapping[str, Any],
+        living_room_config: dict[str, Any],
+    ) -> None:
         """Test editing an existing room through options flow."""
         config_entry = MockConfigEntry(
             domain=DOMAIN,
             data={
-                "name": "Test Advisor",
-                "outdoor_temp_sensor": "sensor.outdoor_temp",
-                "outdoor_humidity_sensor": "sensor.outdoor_humidity",
-                "wind_sensor": "sensor.wind_speed",
-                "scan_interval": 300,
+                **base_entry_data,
                 CONF_ROOMS: {
-                    "Living Room": {
-                        CONF_ROOM_NAME: "Living Room",
-                        CONF_TEMP_SENSOR: "sensor.living_temp",
-                        CONF_HUMIDITY_SENSOR: "sensor.living_humidity",
-                        CONF_ROOM_TYPE: "living_room",
-                        CONF_CO2_SENSOR: "sensor.living_co2",
-                        CONF_ENABLED: True,
-                    },
+                    "Living Room": living_room_config,
                 },
             },
             options={},
         )
         config_entry.add_to_hass(hass)
 
-        flow = RoomVentilationAdvisorOptionsFlow(config_entry)
-        flow.hass = hass
+        flow = make_options_flow(config_entry)
 
         # Navigate to edit room
         await flow.async_step_init({"configure_rooms": True})
@@ -800,15 +667,12 @@ class TestRoomVentilationAdvisorOptionsFlow:
             {"edit_room": True, "room_to_edit": "Living Room"},
         )
 
-        assert result["type"] == FlowResultType.FORM
-        assert result["step_id"] == "edit_room"
+        _assert_form(result, "edit_room")
 
         # Edit the room
         updated_room_data = {
-            CONF_ROOM_NAME: "Living Room",
+            **living_room_config,
             CONF_TEMP_SENSOR: "sensor.living_temp_new",
-            CONF_HUMIDITY_SENSOR: "sensor.living_humidity",
-            CONF_ROOM_TYPE: "living_room",
             CONF_CO2_SENSOR: "sensor.living_co2_new",
             CONF_ENABLED: False,
         }
@@ -830,81 +694,60 @@ class TestRoomVentilationAdvisorOptionsFlow:
         )
         assert updated_data[CONF_ROOMS]["Living Room"][CONF_ENABLED] is False
 
-    async def test_options_flow_remove_room(self, hass: HomeAssistant) -> None:
-        """Test removing a room through options flow."""
+    @pytest.mark.parametrize(
+        "room_names",
+        [("Living Room", "Kitchen"), ("Test Room",)],
+    )
+    async def test_options_flow_remove_room(
+        self,
+        hass: HomeAssistant,
+        make_options_flow: OptionsFlowFactory,
+        base_entry_data: Mapping[str, Any],
+        stored_rooms: dict[str, dict[str, Any]],
+        room_names: tuple[str, ...],
+    ) -> None:
+        """Test removing the first of the given rooms through options flow."""
+        room_name = room_names[0]
         config_entry = MockConfigEntry(
             domain=DOMAIN,
             data={
-                "name": "Test Advisor",
-                "outdoor_temp_sensor": "sensor.outdoor_temp",
-                "outdoor_humidity_sensor": "sensor.outdoor_humidity",
-                "wind_sensor": "sensor.wind_speed",
-                "scan_interval": 300,
-                CONF_ROOMS: {
-                    "Living Room": {
-                        CONF_ROOM_NAME: "Living Room",
-                        CONF_TEMP_SENSOR: "sensor.living_temp",
-                        CONF_HUMIDITY_SENSOR: "sensor.living_humidity",
-                        CONF_ROOM_TYPE: "living_room",
-                    },
-                    "Kitchen": {
-                        CONF_ROOM_NAME: "Kitchen",
-                        CONF_TEMP_SENSOR: "sensor.kitchen_temp",
-                        CONF_HUMIDITY_SENSOR: "sensor.kitchen_humidity",
-                        CONF_ROOM_TYPE: "kitchen",
-                    },
-                },
+                **base_entry_data,
+                CONF_ROOMS: {name: stored_rooms[name] for name in room_names},
             },
             options={},
         )
         config_entry.add_to_hass(hass)
 
-        flow = RoomVentilationAdvisorOptionsFlow(config_entry)
-        flow.hass = hass
+        flow = make_options_flow(config_entry)
 
         # Navigate to remove room
         await flow.async_step_init({"configure_rooms": True})
         result = await flow.async_step_rooms(
-            {"remove_room": True, "room_to_remove": "Living Room"},
+            {"remove_room": True, "room_to_remove": room_name},
         )
 
-        assert result["type"] == FlowResultType.FORM
-        assert result["step_id"] == "remove_room"
+        _assert_form(result, "remove_room")
+
+        # Check that placeholder is properly replaced
+        assert result["description_placeholders"]["room_name"] == room_name
 
         # Confirm removal
         result = await flow.async_step_remove_room({"confirm_remove": True})
 
         assert result["type"] == FlowResultType.CREATE_ENTRY
 
-        # Verify room was removed
-        updated_data = config_entry.data
-        assert "Living Room" not in updated_data[CONF_ROOMS]
-        assert "Kitchen" in updated_data[CONF_ROOMS]  # Other room should remain
+        # Verify only the selected room was removed
+        assert config_entry.data[CONF_ROOMS].keys() == set(room_names) - {room_name}
 
     async def test_options_flow_co2_sensor_schema_validation(
         self,
-        hass: HomeAssistant,
+        single_room_entry: MockConfigEntry,
+        single_room_config: dict[str, Any],
+        make_options_flow: OptionsFlowFactory,
     ) -> None:
         """Test that CO2 sensor field handles empty strings correctly."""
-        # Create a mock config entry
-        config_entry = MockConfigEntry(
-            domain=DOMAIN,
-            data={
-                CONF_ROOMS: {
-                    "Test Room": {
-                        CONF_ROOM_TYPE: "living_room",
-                        CONF_HUMIDITY_SENSOR: "sensor.humidity",
-                        CONF_TEMP_SENSOR: "sensor.temperature",
-                        CONF_CO2_SENSOR: None,  # Initially None
-                        CONF_ENABLED: True,
-                    },
-                },
-            },
-        )
-
-        # Create options flow
-        flow = RoomVentilationAdvisorOptionsFlow(config_entry)
-        flow.hass = hass
+        config_entry = single_room_entry
+        flow = make_options_flow(config_entry)
 
         # Navigate to room configuration
         await flow.async_step_init({"configure_rooms": True})
@@ -915,14 +758,7 @@ class TestRoomVentilationAdvisorOptionsFlow:
         schema = flow._get_room_schema(current_config)
 
         # This should not raise an exception with None (empty selection)
-        test_data = {
-            CONF_ROOM_NAME: "Test Room",
-            CONF_ROOM_TYPE: "living_room",
-            CONF_HUMIDITY_SENSOR: "sensor.humidity",
-            CONF_TEMP_SENSOR: "sensor.temperature",
-            CONF_CO2_SENSOR: None,  # None - should be handled gracefully
-            CONF_ENABLED: True,
-        }
+        test_data = {**single_room_config, CONF_ROOM_NAME: "Test Room"}
 
         # Validate the data against the schema
         validated_data = schema(test_data)
@@ -930,52 +766,44 @@ class TestRoomVentilationAdvisorOptionsFlow:
         # None should remain None
         assert validated_data[CONF_CO2_SENSOR] is None
 
-    async def test_options_flow_remove_room_placeholder_and_functionality(
+    async def test_options_flow_room_schema_reused(
+        self,
+        single_room_entry: MockConfigEntry,
+        make_options_flow: OptionsFlowFactory,
+    ) -> None:
+        """Test equal room configs share one schema object."""
+        flow = make_options_flow(single_room_entry)
+        current_config = single_room_entry.data[CONF_ROOMS]["Test Room"]
+
+        assert flow._get_room_schema(current_config) is flow._get_room_schema(
+            dict(current_config),
+        )
+        assert flow._get_room_schema() is not flow._get_room_schema(current_config)
+
+    async def test_options_flow_edit_room_with_unhashable_stored_value(
         self,
         hass: HomeAssistant,
+        make_options_flow: OptionsFlowFactory,
+        base_entry_data: Mapping[str, Any],
+        single_room_config: dict[str, Any],
     ) -> None:
-        """Test remove room placeholder replacement and functionality work correctly."""
-        # Create a mock config entry with a room
+        """Test the edit room step opens with a list-valued CO2 sensor stored."""
+        co2_sensors = ["sensor.test_co2", "sensor.test_co2_2"]
         config_entry = MockConfigEntry(
             domain=DOMAIN,
             data={
+                **base_entry_data,
                 CONF_ROOMS: {
-                    "Test Room": {
-                        CONF_ROOM_TYPE: "living_room",
-                        CONF_HUMIDITY_SENSOR: "sensor.humidity",
-                        CONF_TEMP_SENSOR: "sensor.temperature",
-                        CONF_ENABLED: True,
-                    },
+                    "Test Room": {**single_room_config, CONF_CO2_SENSOR: co2_sensors},
                 },
             },
         )
-
-        # Add the config entry to hass
         config_entry.add_to_hass(hass)
-
-        # Create options flow
-        flow = RoomVentilationAdvisorOptionsFlow(config_entry)
-        flow.hass = hass
-
-        # Navigate to remove room
-        await flow.async_step_init({"configure_rooms": True})
+        flow = make_options_flow(config_entry)
         result = await flow.async_step_rooms(
-            {"remove_room": True, "room_to_remove": "Test Room"},
+            {"edit_room": True, "room_to_edit": "Test Room"},
         )
 
-        assert result["type"] == FlowResultType.FORM
-        assert result["step_id"] == "remove_room"
-
-        # Check that placeholder is properly replaced
-        assert "description_placeholders" in result
-        assert result["description_placeholders"]["room_name"] == "Test Room"
-
-        # Confirm removal - this should actually remove the room
-        result = await flow.async_step_remove_room({"confirm_remove": True})
-
-        # Should save configuration after successful removal
-        assert result["type"] == FlowResultType.CREATE_ENTRY
-
-        # Verify room was actually removed from config
-        updated_data = config_entry.data
-        assert "Test Room" not in updated_data[CONF_ROOMS]
+        _assert_form(result, "edit_room")
+        defaults = {str(key): key.default() for key in result["data_schema"].schema}
+        assert defaults[CONF_CO2_SENSOR] == co2_sensors
@@ -1,5 +1,6 @@
 """Test the Room Ventilation Advisor integration."""
 
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -11,15 +12,30 @@ from custom_components.room_ventilation_advisor import (
 )
 
 
+def _fake_hass() -> SimpleNamespace:
+    """Return a minimal hass stub with async config entry helpers."""
+    return SimpleNamespace(
+        config_entries=SimpleNamespace(
+            async_forward_entry_setups=AsyncMock(),
+            async_unload_platforms=AsyncMock(return_value=True),
+        ),
+    )
+
+
+def _fake_entry(version: int = 1) -> SimpleNamespace:
+    """Return a minimal config entry stub."""
+    return SimpleNamespace(
+        data={"name": "Test Advisor"},
+        entry_id="test_entry_id",
+        version=version,
+    )
+
+
 @pytest.mark.asyncio
 async def test_async_setup_entry() -> None:
     """Test setting up the integration."""
-    hass = MagicMock()
-    config_entry = MagicMock()
-    config_entry.data = {"name": "Test Advisor"}
-
-    # Mock the forward_entry_setups method
-    hass.config_entries.async_forward_entry_setups = AsyncMock()
+    hass = _fake_hass()
+    config_entry = _fake_entry()
 
     # Mock device registry
     with patch("custom_components.room_ventilation_advisor.dr") as mock_dr:
@@ -39,18 +55,13 @@ async def test_async_setup_entry() -> None:
 @pytest.mark.asyncio
 async def test_async_unload_entry() -> None:
     """Test unloading the integration."""
-    hass = MagicMock()
-    config_entry = MagicMock()
-    config_entry.entry_id = "test_entry_id"
-
-    # Mock the unload_platforms method
-    hass.config_entries.async_unload_platforms = AsyncMock(return_value=True)
+    hass = _fake_hass()
+    config_entry = _fake_entry()
 
     # Mock device registry
     with patch("custom_components.room_ventilation_advisor.dr") as mock_dr:
         mock_device_registry = MagicMock()
-        mock_device = MagicMock()
-        mock_device.id = "test_device_id"
+        mock_device = SimpleNamespace(id="test_device_id")
 
         mock_device_registry.async_get_device.return_value = mock_device
         mock_dr.async_get.return_value = mock_device_registry
@@ -70,9 +81,8 @@ async def test_async_unload_entry() -> None:
 @pytest.mark.asyncio
 async def test_async_migrate_entry() -> None:
     """Test migrating config entries."""
-    hass = MagicMock()
-    config_entry = MagicMock()
-    config_entry.version = 1
+    hass = _fake_hass()
+    config_entry = _fake_entry()
 
     result = await async_migrate_entry(hass, config_entry)
 
@@ -82,9 +92,8 @@ async def test_async_migrate_entry() -> None:
 @pytest.mark.asyncio
 async def test_async_migrate_entry_unknown_version() -> None:
     """Test migrating config entries with unknown version."""
-    hass = MagicMock()
-    config_entry = MagicMock()
-    config_entry.version = 999
+    hass = _fake_hass()
+    config_entry = _fake_entry(version=999)
 
     result = await async_migrate_entry(hass, config_entry)
 
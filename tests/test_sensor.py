@@ -1,11 +1,17 @@
 """Test the sensor platform for Room Ventilation Advisor integration."""
 
+from collections.abc import Generator, Mapping
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, State
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from custom_components.room_ventilation_advisor.calculator import (
+    RoomData,
+    VentilationCalculator,
+)
 from custom_components.room_ventilation_advisor.const import (
     CONF_ENABLED,
     CONF_ROOMS,
@@ -22,20 +28,43 @@ from custom_components.room_ventilation_advisor.sensor import (
 )
 
 
+def _seed_states(hass: HomeAssistant, states: Mapping[str, str]) -> None:
+    """Set the given entity states in hass."""
+    for entity_id, state in states.items():
+        hass.states.async_set(entity_id, state)
+
+
+@pytest.fixture
+def outdoor_readings() -> dict[str, float]:
+    """Return the outdoor readings the sensor tests feed into coordinator data."""
+    return {"outdoor_temp": 10, "outdoor_humidity": 70, "wind_speed": 5}
+
+
+@pytest.fixture
+def coordinator(hass: HomeAssistant) -> VentilationDataUpdateCoordinator:
+    """Return a coordinator for an entry with no sensors or rooms configured."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        entry_id="test_entry_id",
+        data={},
+    )
+    return VentilationDataUpdateCoordinator(hass, config_entry)
+
+
+@pytest.fixture
+def sensor(coordinator: VentilationDataUpdateCoordinator) -> VentilationSensor:
+    """Return a sensor for an unconfigured "Test Room" on the coordinator."""
+    return VentilationSensor(coordinator, "Test Room", {})
+
+
 class TestVentilationSensor:
     """Test the VentilationSensor class."""
 
-    async def test_sensor_initialization(self, hass: HomeAssistant) -> None:
+    def test_sensor_initialization(
+        self,
+        coordinator: VentilationDataUpdateCoordinator,
+    ) -> None:
         """Test sensor initialization."""
-        config_entry = MockConfigEntry(
-            domain=DOMAIN,
-            entry_id="test_entry_id",
-            data={},
-        )
-
-        # Create coordinator
-        coordinator = VentilationDataUpdateCoordinator(hass, config_entry)
-
         # Create sensor
         room_config = {
             "temp_sensor": "sensor.temp",
@@ -49,16 +78,11 @@ class TestVentilationSensor:
         assert sensor._attr_name == "Living Room Ventilation Score"
         assert sensor._attr_has_entity_name is True
 
-    async def test_sensor_device_info(self, hass: HomeAssistant) -> None:
+    def test_sensor_device_info(
+        self,
+        sensor: VentilationSensor,
+    ) -> None:
         """Test sensor device info."""
-        config_entry = MockConfigEntry(
-            domain=DOMAIN,
-            entry_id="test_entry_id",
-            data={},
-        )
-        coordinator = VentilationDataUpdateCoordinator(hass, config_entry)
-        sensor = VentilationSensor(coordinator, "Test Room", {})
-
         device_info = sensor._attr_device_info
         assert device_info is not None
         assert "identifiers" in device_info
@@ -66,7 +90,11 @@ class TestVentilationSensor:
         assert device_info["identifiers"] == {(DOMAIN, "test_entry_id")}
         assert device_info["name"] == "Room Ventilation Advisor"
 
-    async def test_sensor_state_and_attributes(self, hass: HomeAssistant) -> None:
+    async def test_sensor_state_and_attributes(
+        self,
+        hass: HomeAssistant,
+        outdoor_readings: dict[str, float],
+    ) -> None:
         """Test sensor state and attributes after coordinator update."""
         config_entry = MockConfigEntry(
             domain=DOMAIN,
@@ -82,11 +110,11 @@ class TestVentilationSensor:
         sensor.hass = hass
         sensor.async_write_ha_state = MagicMock()
 
-        # Mock coordinator data
-        coordinator.data = {
-            "outdoor_temp": 10,
-            "outdoor_humidity": 70,
-            "wind_speed": 5,
+        # Coordinator data at a fixed time, scored the way an update scores it
+        data = {
+            **outdoor_readings,
+            "hour": 12,
+            "month": 1,
             "rooms": {
                 "Living Room": {
                     "indoor_temp": 20,
@@ -96,6 +124,8 @@ class TestVentilationSensor:
                 },
             },
         }
+        data["scores"] = coordinator._calculate_scores(data, data["rooms"])
+        coordinator.data = data
 
         # Manually trigger update
         sensor._handle_coordinator_update()
@@ -120,39 +150,118 @@ class TestVentilationSensor:
         ("score", "expected_icon"),
         [
             (0.8, ICON_VENTILATION_GOOD),
+            (0.5, ICON_VENTILATION_GOOD),
             (0.3, ICON_VENTILATION_MODERATE),
+            (0.0, ICON_VENTILATION_MODERATE),
             (-0.1, ICON_VENTILATION_POOR),
             (None, "mdi:fan"),
         ],
     )
-    async def test_icon_update(
+    def test_icon_update(
         self,
-        hass: HomeAssistant,
+        monkeypatch: pytest.MonkeyPatch,
+        sensor: VentilationSensor,
         score: float | None,
         expected_icon: str,
     ) -> None:
         """Test that the icon updates based on the score."""
-        config_entry = MockConfigEntry(domain=DOMAIN, data={})
-        coordinator = VentilationDataUpdateCoordinator(hass, config_entry)
-        sensor = VentilationSensor(coordinator, "Test Room", {})
+        monkeypatch.setattr(
+            VentilationSensor,
+            "native_value",
+            property(lambda _self: score),
+        )
+        sensor._update_icon()
+        assert sensor.icon == expected_icon
 
-        with patch.object(
+    @pytest.mark.parametrize(
+        ("score", "expected_advice"),
+        [
+            (0.5, "Good ventilation"),
+            (0.0, "Moderate ventilation"),
+            (-0.3, "Poor ventilation"),
+            (-0.31, "Very poor ventilation"),
+            (None, "Unable to calculate"),
+        ],
+    )
+    def test_ventilation_advice(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        sensor: VentilationSensor,
+        score: float | None,
+        expected_advice: str,
+    ) -> None:
+        """Test that the advice matches the score band."""
+        monkeypatch.setattr(
             VentilationSensor,
             "native_value",
-            new_callable=MagicMock,
-        ) as mock_native_value:
-            mock_native_value.__get__ = MagicMock(return_value=score)
-            sensor._update_icon()
-            assert sensor.icon == expected_icon
-
-    async def test_native_value_missing_data(self, hass: HomeAssistant) -> None:
-        """Test native_value returns None when data is missing."""
-        config_entry = MockConfigEntry(domain=DOMAIN, data={})
-        coordinator = VentilationDataUpdateCoordinator(hass, config_entry)
-        sensor = VentilationSensor(coordinator, "Test Room", {})
+            property(lambda _self: score),
+        )
+        assert sensor._get_ventilation_advice().startswith(expected_advice)
+
+    async def test_native_value_uses_coordinator_scores(
+        self,
+        hass: HomeAssistant,
+        coordinator: VentilationDataUpdateCoordinator,
+        sensor: VentilationSensor,
+    ) -> None:
+        """Test native_value reads the score batch-computed by the coordinator."""
+        sensor.hass = hass
+        sensor.async_write_ha_state = MagicMock()
+
+        coordinator.data = {"rooms": {}, "scores": {"Test Room": 0.42}}
+        sensor._handle_coordinator_update()
+        assert sensor.native_value == 0.42
+
+    async def test_native_value_missing_data(
+        self,
+        hass: HomeAssistant,
+        coordinator: VentilationDataUpdateCoordinator,
+        sensor: VentilationSensor,
+    ) -> None:
+        """Test native_value returns None once the coordinator data is missing."""
+        sensor.hass = hass
+        sensor.async_write_ha_state = MagicMock()
+
+        coordinator.data = {"rooms": {}, "scores": {"Test Room": 0.42}}
+        sensor._handle_coordinator_update()
+        assert sensor.native_value == 0.42
 
         # No data in coordinator
         coordinator.data = {}
+        sensor._handle_coordinator_update()
+        assert sensor.native_value is None
+
+    async def test_native_value_follows_coordinator_updates(
+        self,
+        hass: HomeAssistant,
+        coordinator: VentilationDataUpdateCoordinator,
+        outdoor_readings: dict[str, float],
+        sensor: VentilationSensor,
+    ) -> None:
+        """Test native_value is recomputed on every coordinator update."""
+        sensor.hass = hass
+        sensor.async_write_ha_state = MagicMock()
+
+        data = {
+            **outdoor_readings,
+            "hour": 12,
+            "month": 1,
+            "rooms": {
+                "Test Room": {
+                    "indoor_temp": 20,
+                    "indoor_humidity": 60,
+                    "co2_level": None,
+                    "room_type": "bedroom",
+                },
+            },
+        }
+        data["scores"] = coordinator._calculate_scores(data, data["rooms"])
+        coordinator.data = data
+        sensor._handle_coordinator_update()
+        assert isinstance(sensor.native_value, float)
+
+        coordinator.data = {}
+        sensor._handle_coordinator_update()
         assert sensor.native_value is None
 
 
@@ -181,19 +290,21 @@ class TestVentilationDataUpdateCoordinator:
             (None, None),
         ],
     )
-    async def test_get_sensor_value(
+    def test_get_sensor_value(
         self,
-        hass: HomeAssistant,
+        monkeypatch: pytest.MonkeyPatch,
+        coordinator: VentilationDataUpdateCoordinator,
         state: str | None,
         expected_value: float | None,
     ) -> None:
         """Test getting sensor value for various states."""
-        config_entry = MockConfigEntry(domain=DOMAIN, data={})
-        coordinator = VentilationDataUpdateCoordinator(hass, config_entry)
         entity_id = "sensor.test"
-
-        if state is not None:
-            hass.states.async_set(entity_id, state)
+        sensor_state = None if state is None else State(entity_id, state)
+        monkeypatch.setattr(
+            coordinator,
+            "hass",
+            SimpleNamespace(states=SimpleNamespace(get=lambda _: sensor_state)),
+        )
 
         assert coordinator._get_sensor_value(entity_id) == expected_value
 
@@ -224,14 +335,18 @@ class TestVentilationDataUpdateCoordinator:
         )
         coordinator = VentilationDataUpdateCoordinator(hass, config_entry)
 
-        # Set sensor states
-        hass.states.async_set("sensor.outdoor_temp", "10.0")
-        hass.states.async_set("sensor.outdoor_humidity", "75.0")
-        hass.states.async_set("sensor.wind", "5.0")
-        hass.states.async_set("sensor.living_temp", "21.0")
-        hass.states.async_set("sensor.living_humidity", "55.0")
-        hass.states.async_set("sensor.living_co2", "850")
-        hass.states.async_set("sensor.office_temp", "22.0")
+        _seed_states(
+            hass,
+            {
+                "sensor.outdoor_temp": "10.0",
+                "sensor.outdoor_humidity": "75.0",
+                "sensor.wind": "5.0",
+                "sensor.living_temp": "21.0",
+                "sensor.living_humidity": "55.0",
+                "sensor.living_co2": "850",
+                "sensor.office_temp": "22.0",
+            },
+        )
 
         data = await coordinator._async_update_data()
 
@@ -242,56 +357,231 @@ class TestVentilationDataUpdateCoordinator:
         assert "Office" not in data["rooms"]  # Check that disabled room is skipped
         assert data["rooms"]["Living Room"]["indoor_temp"] == 21.0
         assert data["rooms"]["Living Room"]["co2_level"] == 850
+        assert 0 <= data["hour"] <= 23
+        assert 1 <= data["month"] <= 12
+        assert isinstance(data["scores"]["Living Room"], float)
+        assert "Office" not in data["scores"]
+
+    async def test_async_update_data_reads_shared_sensor_once(
+        self,
+        hass: HomeAssistant,
+    ) -> None:
+        """Test a sensor shared by several rooms is read once per update."""
+        config_entry = MockConfigEntry(
+            domain=DOMAIN,
+            data={
+                "outdoor_temp_sensor": "sensor.outdoor_temp",
+                CONF_ROOMS: {
+                    "Kitchen": {
+                        "temp_sensor": "sensor.temp",
+                        "co2_sensor": "sensor.co2",
+                    },
+                    "Office": {
+                        "temp_sensor": "sensor.temp",
+                        "co2_sensor": "sensor.co2",
+                    },
+                },
+            },
+        )
+        coordinator = VentilationDataUpdateCoordinator(hass, config_entry)
+        _seed_states(hass, {"sensor.temp": "21.0", "sensor.co2": "900"})
+
+        with patch.object(
+            coordinator,
+            "_get_sensor_value",
+            wraps=coordinator._get_sensor_value,
+        ) as mock_get_sensor_value:
+            data = await coordinator._async_update_data()
+
+        assert mock_get_sensor_value.call_count == 3
+        assert data["rooms"]["Kitchen"]["co2_level"] == 900
+        assert data["rooms"]["Office"]["indoor_temp"] == 21.0
+
+    async def test_async_update_data_isolates_failing_room(
+        self,
+        hass: HomeAssistant,
+    ) -> None:
+        """Test a room whose score cannot be computed does not fail the update."""
+        config_entry = MockConfigEntry(
+            domain=DOMAIN,
+            data={
+                "outdoor_temp_sensor": "sensor.outdoor_temp",
+                "outdoor_humidity_sensor": "sensor.outdoor_humidity",
+                "wind_sensor": "sensor.wind",
+                CONF_ROOMS: {
+                    "Kitchen": {
+                        "temp_sensor": "sensor.kitchen_temp",
+                        "humidity_sensor": "sensor.kitchen_humidity",
+                        "room_type": "kitchen",
+                    },
+                    "Office": {
+                        "temp_sensor": "sensor.office_temp",
+                        "humidity_sensor": "sensor.office_humidity",
+                        "room_type": "office",
+                    },
+                },
+            },
+        )
+        coordinator = VentilationDataUpdateCoordinator(hass, config_entry)
+        _seed_states(
+            hass,
+            {
+                "sensor.outdoor_temp": "10.0",
+                "sensor.outdoor_humidity": "75.0",
+                "sensor.wind": "5.0",
+                "sensor.kitchen_temp": "21.0",
+                "sensor.kitchen_humidity": "55.0",
+                "sensor.office_temp": "22.0",
+                "sensor.office_humidity": "50.0",
+            },
+        )
+        calculate_room_score = coordinator.calculator.calculate_room_score
+
+        def _fail_for_kitchen(room: RoomData) -> float:
+            if room.room_type == "kitchen":
+                msg = "bad reading"
+                raise ValueError(msg)
+            return calculate_room_score(room)
+
+        with (
+            patch.object(
+                VentilationCalculator,
+                "calculate_room_scores_batch",
+                side_effect=ValueError("bad reading"),
+            ),
+            patch.object(
+                VentilationCalculator,
+                "calculate_room_score",
+                side_effect=_fail_for_kitchen,
+            ),
+        ):
+            data = await coordinator._async_update_data()
+
+        assert "Kitchen" not in data["scores"]
+        assert isinstance(data["scores"]["Office"], float)
 
     async def test_async_update_data_missing_sensor(self, hass: HomeAssistant) -> None:
         """Test data update with a missing sensor."""
         config_entry = MockConfigEntry(
             domain=DOMAIN,
-            data={"outdoor_temp_sensor": "sensor.non_existent"},
+            data={
+                "outdoor_temp_sensor": "sensor.non_existent",
+                CONF_ROOMS: {"Office": {"temp_sensor": "sensor.office_temp"}},
+            },
         )
         coordinator = VentilationDataUpdateCoordinator(hass, config_entry)
 
         # Missing outdoor temp sensor should result in None
         data = await coordinator._async_update_data()
         assert data["outdoor_temp"] is None
+        assert data["scores"] == {}
 
+    async def test_async_update_data_no_enabled_rooms(
+        self,
+        hass: HomeAssistant,
+    ) -> None:
+        """Test no sensors are read while every room is disabled."""
+        config_entry = MockConfigEntry(
+            domain=DOMAIN,
+            data={
+                "outdoor_temp_sensor": "sensor.outdoor_temp",
+                CONF_ROOMS: {
+                    "Office": {"temp_sensor": "sensor.temp", "enabled": False}
+                },
+            },
+        )
+        coordinator = VentilationDataUpdateCoordinator(hass, config_entry)
+        hass.states.async_set("sensor.outdoor_temp", "10.0")
 
-class TestAsyncSetupEntry:
-    """Test the async_setup_entry function."""
-
-    async def test_async_setup_entry_no_rooms(self, hass: HomeAssistant) -> None:
-        """Test async_setup_entry with no rooms configured."""
-        config_entry = MockConfigEntry(domain=DOMAIN, data={CONF_ROOMS: {}})
-        mock_async_add_entities = AsyncMock()
+        with patch.object(coordinator, "_get_sensor_value") as mock_get_sensor_value:
+            data = await coordinator._async_update_data()
 
-        await async_setup_entry(hass, config_entry, mock_async_add_entities)
+        mock_get_sensor_value.assert_not_called()
+        assert data["rooms"] == {}
+        assert data["scores"] == {}
+        assert 0 <= data["hour"] <= 23
+        assert 1 <= data["month"] <= 12
 
-        # Verify no entities were added; ensure update_before_add keyword was used
-        mock_async_add_entities.assert_called_once()
-        called_args, called_kwargs = mock_async_add_entities.call_args
-        assert called_args[0] == []
-        assert called_kwargs.get("update_before_add", False) is True
+        # Each update hands out its own data, nothing shared across entries
+        data["rooms"]["Office"] = {}
+        assert (await coordinator._async_update_data())["rooms"] == {}
 
-    async def test_async_setup_entry_with_rooms(self, hass: HomeAssistant) -> None:
-        """Test async_setup_entry with enabled and disabled rooms."""
+    async def test_async_update_data_follows_entry_options(
+        self,
+        hass: HomeAssistant,
+    ) -> None:
+        """Test sensor ids are re-resolved when the entry options change."""
         config_entry = MockConfigEntry(
             domain=DOMAIN,
             data={
-                CONF_ROOMS: {
-                    "Living Room": {CONF_ENABLED: True, "temp_sensor": "sensor.temp1"},
-                    "Bedroom": {CONF_ENABLED: True, "temp_sensor": "sensor.temp2"},
-                    "Office": {CONF_ENABLED: False, "temp_sensor": "sensor.temp3"},
-                },
+                "outdoor_temp_sensor": "sensor.outdoor_temp",
+                CONF_ROOMS: {"Office": {"temp_sensor": "sensor.office_temp"}},
             },
         )
-        mock_async_add_entities = AsyncMock()
+        config_entry.add_to_hass(hass)
+        coordinator = VentilationDataUpdateCoordinator(hass, config_entry)
+
+        _seed_states(
+            hass,
+            {"sensor.outdoor_temp": "10.0", "sensor.outdoor_temp_2": "12.0"},
+        )
+
+        data = await coordinator._async_update_data()
+        assert data["outdoor_temp"] == 10.0
+
+        hass.config_entries.async_update_entry(
+            config_entry,
+            options={"outdoor_temp_sensor": "sensor.outdoor_temp_2"},
+        )
+        await hass.async_block_till_done()
 
-        with patch(
-            "custom_components.room_ventilation_advisor.sensor.VentilationDataUpdateCoordinator.async_refresh",
+        data = await coordinator._async_update_data()
+        assert data["outdoor_temp"] == 12.0
+
+
+class TestAsyncSetupEntry:
+    """Test the async_setup_entry function."""
+
+    @pytest.fixture(autouse=True)
+    def _no_refresh(self) -> Generator[None]:
+        """Skip the coordinator's initial refresh during platform setup."""
+        with patch.object(
+            VentilationDataUpdateCoordinator,
+            "async_refresh",
             new_callable=AsyncMock,
         ):
-            await async_setup_entry(hass, config_entry, mock_async_add_entities)
+            yield
+
+    @pytest.mark.parametrize("add_entities_mock", [MagicMock, AsyncMock])
+    @pytest.mark.parametrize(
+        ("rooms", "expected_count"),
+        [
+            ({}, 0),
+            (
+                {
+                    "Living Room": {CONF_ENABLED: True, "temp_sensor": "sensor.temp1"},
+                    "Bedroom": {CONF_ENABLED: True, "temp_sensor": "sensor.temp2"},
+                    "Office": {CONF_ENABLED: False, "temp_sensor": "sensor.temp3"},
+                },
+                2,
+            ),
+        ],
+    )
+    async def test_async_setup_entry(
+        self,
+        hass: HomeAssistant,
+        rooms: dict[str, dict[str, object]],
+        expected_count: int,
+        add_entities_mock: type[MagicMock],
+    ) -> None:
+        """Test async_setup_entry adds a sensor for each enabled room."""
+        config_entry = MockConfigEntry(domain=DOMAIN, data={CONF_ROOMS: rooms})
+        mock_async_add_entities = add_entities_mock()
+
+        await async_setup_entry(hass, config_entry, mock_async_add_entities)
 
-        # Verify that two entities were added (Living Room and Bedroom)
-        assert mock_async_add_entities.call_count == 1
-        assert len(mock_async_add_entities.call_args[0][0]) == 2
+        # Both sync and awaitable add-entities callbacks are called exactly once
+        mock_async_add_entities.assert_called_once()
+        called_args, called_kwargs = mock_async_add_entities.call_args
+        assert len(called_args[0]) == expected_count
+        assert called_kwargs.get("update_before_add", False) is True